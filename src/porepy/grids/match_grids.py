@@ -548,8 +548,7 @@ def mdg_refinement(
     np.testing.assert_almost_equal(bmax, bmax_ref, decimal=8)
 
     # Strongly check that grids refer to same domain
-    for i in np.arange(len(subdomains)):
-        sd, sd_ref = subdomains[i], subdomains_ref[i]
+    for sd, sd_ref in zip(subdomains, subdomains_ref):
         assert sd.id == sd_ref
 
         # Compute the mapping for this subdomain-pair, and assign the result to the node
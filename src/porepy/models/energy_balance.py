@@ -673,29 +673,21 @@ class BoundaryConditionsEnergyBalance:
             Array with boundary values for the enthalpy.
 
         """
-        # List for all subdomains
-        bc_values = []
-
-        # Loop over subdomains to collect boundary values
-        for sd in subdomains:
-            vals = np.zeros(sd.num_faces)
-            # If you know the boundary temperature, you might want to reconstruct
-            # the enthalpy flux at the boundary. Using Dirichlet BCs, the value assigned
-            # herein will be multiplied with the Darcy flux -K \nabla p. Thus, one would
-            # normally convert to fluid flux multiplying by (density/viscosity). Then,
-            # if using EnthalpyFromTemperature, one would compute enthalpy value by
-            # multiplying by specific heat capacity and
-            # (boundary temperature - reference temperature). Note that using
-            # non-default constitutive laws in the interior might require changes to the
-            # above recipe.
-
-            #  Append to list of boundary values
-            bc_values.append(vals)
-
-        # Concatenate to single array and wrap as ad.DenseArray
-        bc_values_ad = pp.wrap_as_ad_array(
-            np.hstack(bc_values), name="bc_values_enthalpy"
-        )
+        # Boundary values for all subdomains, with the faces of each subdomain stored
+        # contiguously.
+        num_faces = sum([sd.num_faces for sd in subdomains])
+        vals = np.zeros(num_faces)
+        # If you know the boundary temperature, you might want to reconstruct the
+        # enthalpy flux at the boundary. Using Dirichlet BCs, the value assigned herein
+        # will be multiplied with the Darcy flux -K \nabla p. Thus, one would normally
+        # convert to fluid flux multiplying by (density/viscosity). Then, if using
+        # EnthalpyFromTemperature, one would compute enthalpy value by multiplying by
+        # specific heat capacity and (boundary temperature - reference temperature).
+        # Note that using non-default constitutive laws in the interior might require
+        # changes to the above recipe.
+
+        # Wrap as ad.DenseArray
+        bc_values_ad = pp.wrap_as_ad_array(vals, name="bc_values_enthalpy")
         return bc_values_ad
 
 
@@ -428,25 +428,27 @@ class BoundaryConditionsSinglePhaseFlow:
             Array with boundary values for the mobility.
 
         """
-        # List for all subdomains
-        bc_values: list[np.ndarray] = []
+        # Array for all subdomains, storing the faces of each subdomain contiguously.
+        bc_values = np.zeros(sum([sd.num_faces for sd in subdomains]))
+
+        # Get density and viscosity values on boundary faces applying trace to interior
+        # values. The mobility is constant, and thus the same for all subdomains.
+        mobrho = self.fluid.density() / self.fluid.viscosity()
 
         # Loop over subdomains to collect boundary values
+        offset = 0
         for sd in subdomains:
-            # Get density and viscosity values on boundary faces applying trace to
-            # interior values.
             # Define boundary faces.
             boundary_faces = self.domain_boundary_sides(sd).all_bf
-            # Append to list of boundary values
-            vals = np.zeros(sd.num_faces)
-            vals[boundary_faces] = self.fluid.density() / self.fluid.viscosity()
-            bc_values.append(vals)
+            # Assign the boundary values of this subdomain
+            bc_values[offset + boundary_faces] = mobrho
+            offset += sd.num_faces
 
-        # Concatenate to single array and wrap as ad.DenseArray
+        # Wrap as ad.DenseArray
         # We have forced the type of bc_values_array to be an ad.DenseArray, but mypy does
         # not recognize this. We therefore ignore the typing error.
         bc_values_array: pp.ad.DenseArray = pp.wrap_as_ad_array(  # type: ignore
-            np.hstack(bc_values), name="bc_values_mobility"
+            bc_values, name="bc_values_mobility"
         )
         return bc_values_array
 
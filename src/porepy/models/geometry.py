@@ -46,6 +46,12 @@ class ModelGeometry:
         Cartesian cells.
 
         """
+        # Boundary sides computed for a previous geometry are no longer valid.
+        self._domain_boundary_sides_cache: dict[
+            tuple[int, Optional[float]],
+            tuple[dict[str, pp.number], np.ndarray, pp.domain.DomainSides],
+        ] = {}
+
         # Create the geometry through domain amd fracture set.
         self.set_domain()
         self.set_fractures()
@@ -513,6 +519,11 @@ class ModelGeometry:
         applied to non-box-shaped domains (e.g., domains with perturbed boundary nodes)
         provided `tol` is tuned accordingly.
 
+        The boundary sides are computed once for each subdomain and tolerance, and are
+        stored for later calls. The stored sides are recomputed if the bounding box of
+        the domain or the face centers of the subdomain have changed since. Each call
+        returns copies of the stored arrays, which can be modified freely.
+
         Parameters:
             sd: Subdomain grid.
             tol: Tolerance used to determine whether a face center lies on a boundary side.
@@ -542,8 +553,24 @@ class ModelGeometry:
                 assert all(north_by_index == north_by_name)
 
         """
-        # Get domain boundary sides
+        # Reuse the boundary sides if they have been computed before, for the same
+        # domain and subdomain geometry. The latter may have been modified in place,
+        # e.g., by fracture propagation or grid perturbations.
+        cache: dict[
+            tuple[int, Optional[float]],
+            tuple[dict[str, pp.number], np.ndarray, pp.domain.DomainSides],
+        ] = getattr(self, "_domain_boundary_sides_cache", {})
+        self._domain_boundary_sides_cache = cache
+        key = (sd.id, tol)
         box = copy.deepcopy(self.domain.bounding_box)
+        if key in cache:
+            cached_box, cached_face_centers, cached_sides = cache[key]
+            if cached_box == box and np.array_equal(
+                cached_face_centers, sd.face_centers
+            ):
+                return pp.domain.DomainSides(*(side.copy() for side in cached_sides))
+
+        # Get domain boundary sides
         east = np.abs(box["xmax"] - sd.face_centers[0]) <= tol
         west = np.abs(box["xmin"] - sd.face_centers[0]) <= tol
         if self.mdg.dim_max() == 1:
@@ -565,6 +592,13 @@ class ModelGeometry:
             all_bf, east, west, north, south, top, bottom
         )
 
+        # Store copies, such that modifications by the caller do not affect later calls.
+        cache[key] = (
+            box,
+            sd.face_centers.copy(),
+            pp.domain.DomainSides(*(side.copy() for side in domain_sides)),
+        )
+
         return domain_sides
 
     def internal_boundary_normal_to_outwards(
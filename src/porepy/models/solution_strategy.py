@@ -560,11 +560,16 @@ class SolutionStrategy(abc.ABC):
         """
         A, b = self.linear_system
         t_0 = time.time()
-        logger.debug(f"Max element in A {np.max(np.abs(A)):.2e}")
-        logger.debug(
-            f"""Max {np.max(np.sum(np.abs(A), axis=1)):.2e} and min
-            {np.min(np.sum(np.abs(A), axis=1)):.2e} A sum."""
-        )
+        # The matrix statistics require passes over all entries of A. Only compute
+        # them if they are actually logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            abs_A = np.abs(A)
+            row_sums = np.sum(abs_A, axis=1)
+            logger.debug(f"Max element in A {np.max(abs_A):.2e}")
+            logger.debug(
+                f"""Max {np.max(row_sums):.2e} and min
+                {np.min(row_sums):.2e} A sum."""
+            )
 
         solver = self.linear_solver
         if solver == "pypardiso":
@@ -1,6 +1,7 @@
 """
 Module of coupling laws for hyperbolic equations.
 """
+import hashlib
 from typing import Dict, Tuple
 
 import numpy as np
@@ -32,6 +33,15 @@ class UpwindCoupling(AbstractInterfaceLaw):
 
         self._flux_array_key = "darcy_flux"
 
+        # Keys for the upstream-filtered interface fluxes, stored as arrays. These are
+        # used in the assembly of the coupling terms.
+        self._upwind_flux_primary_key = "upwind_flux_primary"
+        self._upwind_flux_secondary_key = "upwind_flux_secondary"
+        # Key for a flag indicating whether the primary and secondary grids coincide.
+        self._same_grid_key = "_same_grid"
+        # Key for a fingerprint of the Darcy flux used in the latest discretization.
+        self._flux_fingerprint_key = "_flux_fp"
+
     def key(self) -> str:
         return self.keyword + "_"
 
@@ -61,9 +71,32 @@ class UpwindCoupling(AbstractInterfaceLaw):
         matrix_dictionary = data_intf[pp.DISCRETIZATION_MATRICES][self.keyword]
 
         # Normal component of the velocity from the higher dimensional grid
-        lam_flux: np.ndarray = np.sign(
-            data_intf[pp.PARAMETERS][self.keyword][self._flux_array_key]
+        darcy_flux: np.ndarray = data_intf[pp.PARAMETERS][self.keyword][
+            self._flux_array_key
+        ]
+
+        # The discretization only depends on the Darcy flux (and the grids). If the
+        # flux is unchanged since the last discretization, e.g., in a Newton loop with
+        # a fixed velocity field, there is no need to rediscretize. The grids are
+        # included, since the data dictionary may be reused for other grids.
+        fingerprint = (
+            sd_primary.id,
+            sd_secondary.id,
+            intf.id,
+            sd_primary.num_faces,
+            intf.num_cells,
+            hashlib.blake2b(
+                np.ascontiguousarray(darcy_flux).tobytes(), digest_size=8
+            ).digest(),
         )
+        if matrix_dictionary.get(self._flux_fingerprint_key) == fingerprint:
+            return
+
+        # Store whether all contributions should be assembled into the same block. The
+        # grids are compared by identity, so that assembly need not compare grids.
+        matrix_dictionary[self._same_grid_key] = sd_primary is sd_secondary
+
+        lam_flux: np.ndarray = np.sign(darcy_flux)
 
         # mapping from upper dim cells to faces
         # The mortars always points from upper to lower, so we don't flip any
@@ -79,14 +112,15 @@ class UpwindCoupling(AbstractInterfaceLaw):
         matrix_dictionary[self.trace_primary_matrix_key] = trace_h
 
         # Find upwind weighting. if flag is True we use the upper weights
-        # if flag is False we use the lower weighs
-        flag = (lam_flux > 0).astype(float)
-        not_flag = 1 - flag
+        # if flag is False we use the lower weighs.
+        flag = lam_flux > 0
 
         # Discretizations are the flux, but masked so that only the upstream direction
-        # is hit.
-        upwind_from_primary = sps.diags(flag)
-        upwind_from_secondary = sps.diags(not_flag)
+        # is hit. The boolean masks are viewed as 0/1 integers, thus no conversion of
+        # the masks is needed. Products with the (floating point) fluxes and
+        # projections are promoted to floats.
+        upwind_from_primary = sps.diags(flag.view(np.int8))
+        upwind_from_secondary = sps.diags((~flag).view(np.int8))
 
         flux = sps.diags(lam_flux)
 
@@ -94,9 +128,17 @@ class UpwindCoupling(AbstractInterfaceLaw):
         matrix_dictionary[self.upwind_secondary_matrix_key] = upwind_from_secondary
         matrix_dictionary[self.flux_matrix_key] = flux
 
+        # The upstream-filtered fluxes. A positive flux is taken from the primary
+        # side, a negative flux from the secondary side. This is equivalent to the
+        # product of the flux and the upwind masks, but avoids the masks altogether.
+        matrix_dictionary[self._upwind_flux_primary_key] = np.maximum(darcy_flux, 0)
+        matrix_dictionary[self._upwind_flux_secondary_key] = np.minimum(darcy_flux, 0)
+
         # Identity matrix, to represent the mortar variable itself
         matrix_dictionary[self.mortar_discr_matrix_key] = sps.eye(intf.num_cells)
 
+        matrix_dictionary[self._flux_fingerprint_key] = fingerprint
+
     def assemble_matrix_rhs(
         self,
         sd_primary: pp.Grid,
@@ -120,12 +162,14 @@ class UpwindCoupling(AbstractInterfaceLaw):
                 grid
             data_intf: dictionary which stores the data for the edges of the grid
                 bucket
-            matrix: Uncoupled discretization matrix.
+            matrix: Uncoupled discretization matrix. The matrix is not modified by
+                this method, thus calls for different interfaces can safely be run
+                concurrently.
 
         Returns:
             cc: block matrix which store the contribution of the coupling
-                condition. See the abstract coupling class for a more detailed
-                description.
+                condition, added to a copy of the uncoupled discretization matrix.
+                See the abstract coupling class for a more detailed description.
 
         """
 
@@ -133,13 +177,13 @@ class UpwindCoupling(AbstractInterfaceLaw):
             pp.DISCRETIZATION_MATRICES
         ][self.keyword]
         # Retrieve the number of degrees of both grids
-        # Create the block matrix for the contributions
-
         # We know the number of dofs from the primary and secondary side from their
         # discretizations
         dof = np.array([matrix[0, 0].shape[1], matrix[1, 1].shape[1], intf.num_cells])
-        cc = np.array([sps.coo_matrix((i, j)) for i in dof for j in dof])
-        cc = cc.reshape((3, 3))
+
+        # Create the block matrix for the contributions. Only the blocks in the last
+        # row and column are nonzero, the remaining blocks are left empty (None).
+        cc = np.empty((3, 3), dtype=object)
 
         # Trace operator for higher-dimensional grid
         trace_primary: sps.spmatrix = matrix_dictionary[self.trace_primary_matrix_key]
@@ -148,22 +192,17 @@ class UpwindCoupling(AbstractInterfaceLaw):
             self.inv_trace_primary_matrix_key
         ]
 
-        # Upwind operators
-        upwind_primary: sps.spmatrix = matrix_dictionary[self.upwind_primary_matrix_key]
-        upwind_secondary: sps.spmatrix = matrix_dictionary[
-            self.upwind_secondary_matrix_key
+        # The advective flux, filtered so that only the upstream direction is hit.
+        upwind_flux_primary: np.ndarray = matrix_dictionary[
+            self._upwind_flux_primary_key
+        ]
+        upwind_flux_secondary: np.ndarray = matrix_dictionary[
+            self._upwind_flux_secondary_key
         ]
-        flux: sps.spmatrix = matrix_dictionary[self.flux_matrix_key]
 
         # The mortar variable itself.
         mortar_discr: sps.spmatrix = matrix_dictionary[self.mortar_discr_matrix_key]
 
-        # The advective flux
-        lam_flux: np.ndarray = np.abs(
-            data_intf[pp.PARAMETERS][self.keyword][self._flux_array_key]
-        )
-        scaling = sps.dia_matrix((lam_flux, 0), shape=(intf.num_cells, intf.num_cells))
-
         # assemble matrices
         # Note the sign convention: The Darcy mortar flux is positive if it goes
         # from sd_primary to sd_secondary. Thus, a positive transport flux (assuming positive
@@ -182,9 +221,7 @@ class UpwindCoupling(AbstractInterfaceLaw):
         # We set cc[2, 0] = T_primaryat * fluid_flux
         # Use averaged projection operator for an intensive quantity
         cc[2, 0] = (
-            scaling
-            * flux
-            * upwind_primary
+            sps.diags(upwind_flux_primary)
             * intf.primary_to_mortar_avg()
             * trace_primary
         )
@@ -193,17 +230,12 @@ class UpwindCoupling(AbstractInterfaceLaw):
         # i.e., T_check * fluid_flux = lambda.
         # we set cc[2, 1] = T_check * fluid_flux
         # Use averaged projection operator for an intensive quantity
-        cc[2, 1] = scaling * flux * upwind_secondary * intf.secondary_to_mortar_avg()
+        cc[2, 1] = sps.diags(upwind_flux_secondary) * intf.secondary_to_mortar_avg()
 
         # The rhs of T * fluid_flux = lambda
         # Recover the information for the grid-grid mapping
         cc[2, 2] = -mortar_discr
 
-        if sd_primary == sd_secondary:
-            # All contributions to be returned to the same block of the
-            # global matrix in this case
-            cc = np.array([np.sum(cc, axis=(0, 1))])
-
         # rhs is zero
         rhs = np.array(
             [np.zeros(dof[0]), np.zeros(dof[1]), np.zeros(dof[2])], dtype=object
@@ -213,8 +245,22 @@ class UpwindCoupling(AbstractInterfaceLaw):
             # definition of rhs a bit special then.
             rhs = rhs.ravel()
 
-        matrix += cc
-        return matrix, rhs
+        # The coupling terms are added to a new block matrix, rather than updating the
+        # input matrix in place; this way, no state shared between interfaces is
+        # written to during assembly.
+        if matrix_dictionary[self._same_grid_key]:
+            # All contributions to be returned to the same block of the
+            # global matrix in this case. Only the blocks assigned above are
+            # nonzero, thus it suffices to sum these.
+            total = cc[0, 2] + cc[1, 2] + cc[2, 0] + cc[2, 1] + cc[2, 2]
+            return matrix + np.array([[total]], dtype=object), rhs
+
+        # Only the nonzero blocks are updated, which saves sparse additions of the
+        # empty blocks. The remaining blocks are shared with the input matrix.
+        coupled_matrix = matrix.copy()
+        for i, j in ((0, 2), (1, 2), (2, 0), (2, 1), (2, 2)):
+            coupled_matrix[i, j] = matrix[i, j] + cc[i, j]
+        return coupled_matrix, rhs
 
     def cfl(
         self,
@@ -309,10 +355,11 @@ class UpwindCoupling(AbstractInterfaceLaw):
         # dimensional grid
         dist = 0.5 * np.divide(aperture_secondary, aperture_primary)
         # Since darcy_flux is multiplied by the aperture wighted face areas, we
-        # divide through that quantity to get velocities in [length/time]
-        velocity = np.divide(
-            darcy_flux[faces_primary],
-            sd_primary.face_areas[faces_primary] * aperture_primary,
+        # divide through that quantity to get velocities in [length/time]. The
+        # inverse is formed once, so that the velocity is found by a multiplication.
+        inv_weighted_area = 1.0 / (
+            sd_primary.face_areas[faces_primary] * aperture_primary
         )
+        velocity = darcy_flux[faces_primary] * inv_weighted_area
         # deltaT is deltaX/velocity with coefficient
         return np.amin(np.abs(np.divide(dist, velocity)) * phi_secondary)
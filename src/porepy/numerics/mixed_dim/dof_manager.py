@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import itertools
-from typing import Literal, Optional, Sequence, TypeVar
+from typing import Iterator, Literal, Optional, TypeVar
 
+import numba
 import numpy as np
 import scipy.sparse as sps
 
@@ -49,9 +50,6 @@ class DofManager:
         self.mdg: pp.MixedDimensionalGrid = mdg
         """Mixed-dimensional grid."""
 
-        # Counter for block index
-        block_dof_counter = 0
-
         # Dictionary that maps node/edge + variable combination to an index.
         block_dof: dict[tuple[GridLike, str], int] = {}
 
@@ -59,43 +57,27 @@ class DofManager:
         # to the ordering specified in block_dof
         full_dof: list[int] = []
 
-        for sd, data in mdg.subdomains(return_data=True):
+        # Data dictionary of the subdomain or interface of each block.
+        block_data: list[dict] = []
+
+        # Subdomains and interfaces are treated in a single loop; subdomains first.
+        for g, data in itertools.chain(
+            mdg.subdomains(return_data=True), mdg.interfaces(return_data=True)
+        ):
             if pp.PRIMARY_VARIABLES not in data:
                 continue
 
             for local_var, local_dofs in data[pp.PRIMARY_VARIABLES].items():
-                # First assign a block index.
+                # First assign a block index, which is the number of blocks so far.
                 # Note that the keys in the dictionary is a tuple, with a grid
                 # and a variable name (str)
-                block_dof[(sd, local_var)] = block_dof_counter
-                block_dof_counter += 1
-
+                block_dof[(g, local_var)] = len(full_dof)
                 # Count number of dofs for this variable on this grid and store it.
-                # The number of dofs for each grid entitiy type defaults to zero.
-                total_local_dofs = (
-                    sd.num_cells * local_dofs.get("cells", 0)
-                    + sd.num_faces * local_dofs.get("faces", 0)
-                    + sd.num_nodes * local_dofs.get("nodes", 0)
-                )
-                full_dof.append(total_local_dofs)
-
-        for intf, data in mdg.interfaces(return_data=True):
-            if pp.PRIMARY_VARIABLES not in data:
-                continue
-
-            for local_var, local_dofs in data[pp.PRIMARY_VARIABLES].items():
-                # First count the number of dofs per variable. Note that the
-                # identifier here is a tuple of the edge and a variable str.
-                block_dof[(intf, local_var)] = block_dof_counter
-                block_dof_counter += 1
-
-                # We only allow for cell variables on the mortar grid.
-                # This will not change in the foreseeable future
-                total_local_dofs = intf.num_cells * local_dofs.get("cells", 0)
-                full_dof.append(total_local_dofs)
+                full_dof.append(self._num_block_dofs(g, local_dofs))
+                block_data.append(data)
 
         # Array version of the number of dofs per node/edge and variable
-        self.full_dof: np.ndarray = np.array(full_dof)
+        self.full_dof: np.ndarray = np.array(full_dof, dtype=np.int64)
         """Number of dofs for each grid + variable combination. The ordering is
         specified by the numbering in ``self.block_dof``.
 
@@ -104,6 +86,96 @@ class DofManager:
         self.block_dof: dict[tuple[GridLike, str], int] = block_dof
         """Maps grid + variable combination to an index."""
 
+        self._block_data: list[dict] = block_data
+        """Data dictionary of the subdomain or interface of each block, indexed by the
+        block index. Avoids looking up the data in the mixed-dimensional grid when
+        values are distributed or assembled.
+
+        """
+
+        self._dof_start: np.ndarray = np.concatenate(
+            (np.zeros(1, dtype=np.int64), np.cumsum(self.full_dof))
+        )
+        """Start index of the dofs of each block in the global ordering, with the
+        total number of dofs appended. The dofs of block ``i`` are thus found in the
+        range ``[_dof_start[i], _dof_start[i + 1])``.
+
+        """
+
+        self._num_dofs: int = int(self._dof_start[-1])
+        """Total number of dofs, i.e. the sum of ``full_dof``."""
+
+        self._block_start: np.ndarray = self._dof_start[:-1]
+        """Start index of the dofs of each block in the global ordering. Together with
+        ``full_dof``, which holds the length of each block, this is a compressed
+        (start, length) representation of the contiguous dof blocks.
+
+        """
+
+        # Blocks are numbered grid by grid, in the order of the grids in the
+        # mixed-dimensional grid. Store the position of the grid of each block in this
+        # ordering, and the blocks of each variable, to allow for vectorized lookup of
+        # the blocks of a set of variables.
+        block_grid: list[int] = []
+        var_to_blocks: dict[str, list[int]] = {}
+        var_to_grids: dict[str, list[GridLike]] = {}
+        grid_positions: dict[GridLike, int] = {}
+        for (g, var), block_ind in block_dof.items():
+            block_grid.append(grid_positions.setdefault(g, len(grid_positions)))
+            var_to_blocks.setdefault(var, []).append(block_ind)
+            var_to_grids.setdefault(var, []).append(g)
+
+        self._grids: list[GridLike] = list(grid_positions)
+        """Subdomains and interfaces which are assigned dofs, in the order of the
+        blocks.
+
+        """
+
+        self._block_grid: np.ndarray = np.array(block_grid, dtype=np.int64)
+        """Position of the grid of each block in the ordering of the grids."""
+
+        self._var_to_blocks: dict[str, np.ndarray] = {
+            var: np.array(blocks, dtype=np.int64)
+            for var, blocks in var_to_blocks.items()
+        }
+        """Map from variable name to the indices of its blocks, sorted by grid."""
+
+        self._var_to_grids: dict[str, list[GridLike]] = var_to_grids
+        """Map from variable name to the grids on which it is defined, in the same
+        order as the blocks in ``_var_to_blocks``.
+
+        """
+
+        self._inv_block_dof: dict[int, tuple[GridLike, str]] = {
+            v: k for k, v in block_dof.items()
+        }
+        """Inverse of ``block_dof``, maps block index to grid + variable combination."""
+
+    @staticmethod
+    def _num_block_dofs(g: GridLike, local_dofs: dict[str, int]) -> int:
+        """Count the number of dofs of a variable on a subdomain or interface.
+
+        Parameters:
+            g: Subdomain or interface.
+            local_dofs: Number of dofs per grid entity type, as specified in
+                ``data[pp.PRIMARY_VARIABLES]``.
+
+        Returns:
+            Total number of dofs of the variable on the grid.
+
+        """
+        if isinstance(g, pp.MortarGrid):
+            # We only allow for cell variables on the mortar grid.
+            # This will not change in the foreseeable future
+            return g.num_cells * local_dofs.get("cells", 0)
+
+        # The number of dofs for each grid entitiy type defaults to zero.
+        return (
+            g.num_cells * local_dofs.get("cells", 0)
+            + g.num_faces * local_dofs.get("faces", 0)
+            + g.num_nodes * local_dofs.get("nodes", 0)
+        )
+
     def dofs_of(self, variables: list[pp.ad.Variable]) -> np.ndarray:
         """Get the indices in the global vector of unknowns belonging to the variables.
 
@@ -132,9 +204,9 @@ class DofManager:
             # else:
             dofs.append(self.grid_and_variable_to_dofs(v.domain, v.name))
         if len(dofs) > 0:
-            return np.concatenate(dofs, dtype=int)
+            return np.concatenate(dofs, dtype=np.int64)
         else:
-            return np.array([], dtype=int)
+            return np.array([], dtype=np.int64)
 
     def grid_and_variable_to_dofs(self, grid: GridLike, variable: str) -> np.ndarray:
         """Get the indices in the global system of variables associated with a
@@ -150,8 +222,27 @@ class DofManager:
 
         """
         block_ind = self.block_dof[(grid, variable)]
-        dof_start = np.hstack((0, np.cumsum(self.full_dof)))
-        return np.arange(dof_start[block_ind], dof_start[block_ind + 1])
+        return np.arange(
+            self._dof_start[block_ind], self._dof_start[block_ind + 1], dtype=np.intp
+        )
+
+    def grid_and_variable_to_slice(self, grid: GridLike, variable: str) -> slice:
+        """Get the slice in the global system of variables associated with a given
+        node / edge (in the MixedDimensionalGrid sense) and a given variable.
+
+        The dofs of a grid-variable combination are contiguous, thus indexing with the
+        slice gives a view of the global vector, rather than a copy.
+
+        Parameters:
+            grid: Either a grid or an edge in the MixedDimensionalGrid.
+            variable: Name of a variable.
+
+        Returns:
+            Slice of the degrees of freedom for this variable.
+
+        """
+        block_ind = self.block_dof[(grid, variable)]
+        return slice(self._dof_start[block_ind], self._dof_start[block_ind + 1])
 
     def grid_and_variable_block_range(
         self,
@@ -191,32 +282,36 @@ class DofManager:
 
         """
         if grids is None:
-            grids = list(set([key[0] for key in self.block_dof]))
+            grids = list(self._grids)
         if variables is None:
-            variables = list(set([key[1] for key in self.block_dof]))
+            variables = list(self._var_to_blocks)
+
+        grid_set = set(grids)
+        variable_set = set(variables)
 
         # Get the range of all grid-variable combinations.
         # The iteration strategy depends on the specified output format, given by
-        # the value of sort_by.
+        # the value of sort_by. In all cases, only combinations which are assigned
+        # dofs are visited, which avoids membership tests for all combinations in the
+        # product of grids and variables.
         pairs: dict = {}
         # TODO: Match-switch, but we're not yet at Python 3.10
         if sort_by == "grids":
-            for g in grids:
-                this_g = {}
-                for var in variables:
-                    if (g, var) in self.block_dof:
-                        this_g[var] = self._block_range_from_grid_and_var(g, var)
-                pairs[g] = this_g
+            pairs = {g: {} for g in grids}
+            for g, var in self.block_dof:
+                if g in grid_set and var in variable_set:
+                    pairs[g][var] = self._block_range_from_grid_and_var(g, var)
         elif sort_by == "variables":
+            # Look up the grids of each variable directly.
             for var in variables:
-                this_var = {}
-                for g in grids:
-                    if (g, var) in self.block_dof:
-                        this_var[g] = self._block_range_from_grid_and_var(g, var)
-                pairs[var] = this_var
+                pairs[var] = {
+                    g: self._block_range_from_grid_and_var(g, var)
+                    for g in self._var_to_grids.get(var, [])
+                    if g in grid_set
+                }
         elif sort_by == "":
-            for g, var in itertools.product(grids, variables):
-                if (g, var) in self.block_dof:
+            for g, var in self.block_dof:
+                if g in grid_set and var in variable_set:
                     pairs[(g, var)] = self._block_range_from_grid_and_var(g, var)
         else:
             s = f"Invalid value for sort_by: {sort_by}."
@@ -234,44 +329,39 @@ class DofManager:
                     # This is a subdomain
                     return f"Grid with name {grid.name}"
 
-            s = ""
+            # Collect the lines of information and join them in the end.
+            parts: list[str] = []
             # Build the string of information according to the specified formatting.
             if sort_by == "grids":
                 for g, vals in pairs.items():
-                    s += grid_str(g) + "\n"
+                    parts.append(grid_str(g) + "\n")
                     # Loop over variables alphabetically sorted
                     sorted_vars = sorted(list(vals.keys()), key=str.casefold)
                     for var in sorted_vars:
                         limits = vals[var]
-                        s += (
-                            "\t"
-                            + f"Variable: {var}. Range: ({limits[0]}, {limits[1]})"
-                            + "\n"
+                        parts.append(
+                            f"\tVariable: {var}. Range: ({limits[0]}, {limits[1]})\n"
                         )
-                    s += "\n"
+                    parts.append("\n")
             elif sort_by == "variables":
                 # Loop over variables alphabetically sorted
                 sorted_vars = sorted(pairs.keys(), key=str.casefold)
                 for var in sorted_vars:
-                    s += f"Variable {var}" + "\n"
+                    parts.append(f"Variable {var}\n")
                     vals = pairs[var]
                     for g, limits in vals.items():
-                        s += (
-                            "\t"
-                            + grid_str(g)
-                            + f" Range: ({limits[0]}, {limits[1]})"
-                            + "\n"
+                        parts.append(
+                            f"\t{grid_str(g)} Range: ({limits[0]}, {limits[1]})\n"
                         )
-                    s += "\n"
+                    parts.append("\n")
             else:
                 for key, limits in pairs.items():
-                    s += (
+                    parts.append(
                         grid_str(key[0])
-                        + f", variable {key[1]}. Range: ({limits[0]}, {limits[1]})"
-                        + "\n"
+                        + f", variable {key[1]}. Range: ({limits[0]}, {limits[1]})\n"
                     )
 
-            return s
+            return "".join(parts)
         else:
             return pairs
 
@@ -291,21 +381,50 @@ class DofManager:
             ValueError: If the given index is negative or larger than the system size.
 
         """
-        dof_start = np.hstack((0, np.cumsum(self.full_dof)))
+        dof_start = self._dof_start
 
         if ind >= dof_start[-1]:
             raise ValueError(f"Index {ind} is larger than system size {dof_start[-1]}")
         elif ind < 0:
             raise ValueError("Dof indices should be non-negative")
 
-        # Find the block index of this grid-variable combination
-        block_ind = np.argmax(dof_start > ind) - 1
+        # Find the block index of this grid-variable combination. Use side="right" to
+        # skip past blocks without dofs.
+        block_ind = int(np.searchsorted(dof_start, ind, side="right")) - 1
 
-        # Invert the block-dof map to make reverse loopup easy.
-        inv_block_dof: dict[int, tuple[GridLike, str]] = {
-            v: k for k, v in self.block_dof.items()
-        }
-        return inv_block_dof[block_ind]  # type: ignore
+        return self._inv_block_dof[block_ind]
+
+    def dofs_to_grid_and_variable(
+        self, inds: np.ndarray
+    ) -> list[tuple[GridLike, str]]:
+        """Find the grids (or grid pairs) and variable names for a set of degrees of
+        freedom, specified by their indices in the global ordering.
+
+        Vectorized version of :meth:`dof_to_grid_and_variable`.
+
+        Parameters:
+            inds: Indices of degrees of freedom.
+
+        Returns:
+            List of the grid and variable name for each of the degrees of freedom.
+
+        Raises:
+            ValueError: If any of the given indices is negative or larger than the
+                system size.
+
+        """
+        inds = np.asarray(inds)
+        dof_start = self._dof_start
+
+        if np.any(inds >= dof_start[-1]):
+            raise ValueError(
+                f"Index {inds.max()} is larger than system size {dof_start[-1]}"
+            )
+        elif np.any(inds < 0):
+            raise ValueError("Dof indices should be non-negative")
+
+        block_inds = np.searchsorted(dof_start, inds, side="right") - 1
+        return [self._inv_block_dof[b] for b in block_inds.tolist()]
 
     def get_variable_values(
         self,
@@ -399,8 +518,8 @@ class DofManager:
 
         """
         block_ind = self.block_dof[(g, variable)]
-        dof_start = np.hstack((0, np.cumsum(self.full_dof)))
-        return (dof_start[block_ind], dof_start[block_ind + 1])
+        start = self._block_start[block_ind]
+        return (start, start + self.full_dof[block_ind])
 
     def _dof_range_from_grid_and_var(self, g: GridLike, variable: str):
         """Helper function to get the indices for a grid-variable combination.
@@ -443,25 +562,34 @@ class DofManager:
         """
         if not isinstance(var, list):
             var = [var]  # type: ignore
-        dofs = np.empty(0, dtype=int)
-        dof_start = np.hstack((0, np.cumsum(self.full_dof)))
-
-        grids: Sequence[GridLike] = [sd for sd in self.mdg.subdomains()] + [
-            intf for intf in self.mdg.interfaces()  # type: ignore
-        ]
-        for g in grids:
-            for v in var:
-                if (g, v) in self.block_dof:
-                    block_ind = self.block_dof[(g, v)]
-                    local_dofs = np.arange(
-                        dof_start[block_ind], dof_start[block_ind + 1]
-                    )
-                    dofs = np.hstack((dofs, local_dofs))
+
+        # Collect the blocks of the requested variables. The blocks are ordered by
+        # grid, and for each grid in the order of the variables in var.
+        empty = np.empty(0, dtype=np.int64)
+        var_blocks = [self._var_to_blocks.get(v, empty) for v in var]
+        block_inds = np.concatenate([empty] + var_blocks)
+        var_pos = np.repeat(np.arange(len(var)), [b.size for b in var_blocks])
+        block_inds = block_inds[np.lexsort((var_pos, self._block_grid[block_inds]))]
+
+        # Expand the (start, length) pairs of the blocks into indices in one go.
+        dofs = _expand_blocks(self._block_start[block_inds], self.full_dof[block_inds])
 
         if return_projection:
+            # The sparsity pattern is known, with exactly one nonzero per row, thus
+            # the compressed format is constructed directly instead of going through
+            # the coordinate format.
+            shape = (dofs.size, self._num_dofs)
+            if matrix_format is sps.csc_matrix:
+                # The nonzero of column j (if any) is in the row i with dofs[i] == j.
+                # The dofs are unique, thus each column has at most one nonzero.
+                indptr = np.zeros(self._num_dofs + 1, dtype=np.int64)
+                indptr[1:] = np.cumsum(np.bincount(dofs, minlength=self._num_dofs))
+                indices = np.argsort(dofs)
+            else:
+                indptr = np.arange(dofs.size + 1)
+                indices = dofs
             projection = matrix_format(
-                (np.ones(dofs.size), (np.arange(dofs.size), dofs)),
-                shape=(dofs.size, np.sum(self.full_dof)),
+                (np.ones(dofs.size), indices, indptr), shape=shape
             )
             return dofs, projection
 
@@ -469,14 +597,47 @@ class DofManager:
 
     def num_dofs(
         self,
-    ) -> np.int_:
+    ) -> int:
         """Get the number of degrees of freedom in this DofManager.
 
         Returns:
-            np.int_: Size of subsystem.
+            int: Size of subsystem.
 
         """
-        return np.sum(self.full_dof)
+        return self._num_dofs
+
+    def _blocks_in_order(
+        self,
+        grids: Optional[list[GridLike]] = None,
+        variables: Optional[list[str]] = None,
+    ) -> Iterator[tuple[str, dict, slice]]:
+        """Iterate over the blocks of grid-variable combinations, sorted by their
+        position in the global ordering.
+
+        Parameters:
+            grids: Grids (subdomains and interfaces) to consider. If not provided, all
+                grids which are assigned dofs are considered.
+            variables: Names of the variables to consider. If not provided, all
+                variables are considered.
+
+        Yields:
+            Variable name, data dictionary of the grid and slice of the global indices
+            of the block, for each combination which is assigned dofs. The slices are
+            strictly increasing, thus a vector of unknowns is traversed sequentially.
+
+        """
+        grid_set = None if grids is None else set(grids)
+        variable_set = None if variables is None else set(variables)
+
+        for block_ind in range(self.full_dof.size):
+            g, var = self._inv_block_dof[block_ind]
+            if grid_set is not None and g not in grid_set:
+                continue
+            if variable_set is not None and var not in variable_set:
+                continue
+            start = self._block_start[block_ind]
+            end = start + self.full_dof[block_ind]
+            yield var, self._block_data[block_ind], slice(start, end)
 
     def distribute_variable(
         self,
@@ -491,6 +652,11 @@ class DofManager:
         The intended use is to split a multi-physics solution vector into its
         component parts.
 
+        The stored values do not share memory with the input vector: In the
+        non-additive case, each block of values is copied exactly once, by
+        ``pp.set_solution_values``, while in the additive case the stored values are
+        updated in place. Thus, values can safely be modified after the call.
+
         Parameters:
             values (np.array): Vector to be split. It is assumed that the ordering in
                 values coresponds to that implied in self._block_dof and self._full_dof.
@@ -510,27 +676,14 @@ class DofManager:
                 (Newton), False at the end of a time step.
 
         """
-        if grids is None:
-            grids = list(set([key[0] for key in self.block_dof]))
-
-        if variables is None:
-            variables = list(set([key[1] for key in self.block_dof]))
-
         # Loop over grid-variable combinations and update data in pp.ITERATE_SOLUTIONS
-        # and pp.TIME_STEP_SOLUTIONS.
-        for g, var in itertools.product(grids, variables):
-            if (g, var) not in self.block_dof:
-                continue
-
-            dof_ind = self.grid_and_variable_to_dofs(g, var)
+        # and pp.TIME_STEP_SOLUTIONS. Only combinations which are assigned dofs are
+        # visited, in the order of the blocks in values.
+        for var, data, dof_ind in self._blocks_in_order(grids, variables):
+            # The block is contiguous, thus this is a view of the values. No copy is
+            # made here, the values are copied when stored (non-additive case).
             vals = values[dof_ind]
 
-            if isinstance(g, pp.MortarGrid):
-                # This is really an edge
-                data = self.mdg.interface_data(g)
-            else:
-                data = self.mdg.subdomain_data(g)
-
             if not to_iterate:
                 pp.set_solution_values(
                     name=var,
@@ -567,51 +720,37 @@ class DofManager:
         Returns:
             np.ndarray: Vector, size equal to self.num_dofs(). Values taken from the
                 solution for those indices corresponding to an active grid-variable
-                combination. Other values are set to zero.
+                combination. Other values are set to zero. The vector is newly
+                allocated and does not share memory with the stored values.
 
         """
-        if grids is None:
-            grids = list(set([key[0] for key in self.block_dof]))
-
-        if variables is None:
-            variables = list(set([key[1] for key in self.block_dof]))
-
         values = np.zeros(self.num_dofs())
 
-        for g, var in itertools.product(grids, variables):
-            if (g, var) not in self.block_dof:
-                continue
-
-            dof_ind = self.grid_and_variable_to_dofs(g, var)
-
-            if isinstance(g, pp.MortarGrid):
-                # This is really an edge
-                data = self.mdg.interface_data(g)
-            else:
-                data = self.mdg.subdomain_data(g)
-
+        # Only combinations which are assigned dofs are visited. The blocks are
+        # traversed in order, thus values is written sequentially.
+        for var, data, dof_ind in self._blocks_in_order(grids, variables):
+            # Copy the stored values directly into the (contiguous) block of the
+            # vector. This is the only copy, no temporary is needed since values does
+            # not share memory with the stored state.
             if from_iterate:
-                # Use copy to avoid nasty bugs.
-                values[dof_ind] = data[pp.ITERATE_SOLUTIONS][var][0].copy()
+                np.copyto(values[dof_ind], data[pp.ITERATE_SOLUTIONS][var][0])
             else:
-                values[dof_ind] = data[pp.TIME_STEP_SOLUTIONS][var][0].copy()
+                np.copyto(values[dof_ind], data[pp.TIME_STEP_SOLUTIONS][var][0])
 
         return values
 
     def __str__(self) -> str:
-        grid_likes = [key[0] for key in self.block_dof]
-        unique_grids = list(set(grid_likes))
-
         num_grids = 0
         num_interfaces = 0
-        for g in unique_grids:
+        for g in self._grids:
             if isinstance(g, pp.Grid):
                 num_grids += 1
             else:
                 num_interfaces += 1
 
-        names = [key[1] for key in self.block_dof]
-        unique_vars = list(set(names))
+        # The variables are the keys of the variable-to-blocks map, no need to
+        # collect them from block_dof.
+        unique_vars = list(self._var_to_blocks)
         s = (
             f"Degree of freedom manager for {num_grids} "
             f"subdomains and {num_interfaces} interfaces.\n"
@@ -624,16 +763,13 @@ class DofManager:
         return s
 
     def __repr__(self) -> str:
-        grid_likes = [key[0] for key in self.block_dof]
-        unique_grids = list(set(grid_likes))
-
         num_grids = 0
         num_interfaces = 0
 
         dim_max = -1
         dim_min = 4
 
-        for g in unique_grids:
+        for g in self._grids:
             if isinstance(g, pp.Grid):
                 num_grids += 1
                 dim_max = max(dim_max, g.dim)
@@ -642,10 +778,44 @@ class DofManager:
                 num_interfaces += 1
 
         s = (
-            f"Degree of freedom manager with in total {self.full_dof.sum()} dofs"
+            f"Degree of freedom manager with in total {self._num_dofs} dofs"
             f" on {num_grids} subdomains and {num_interfaces} interface variables.\n"
             f"Maximum grid dimension: {dim_max}\n"
             f"Minimum grid dimension: {dim_min}\n"
         )
 
         return s
+
+
+def _expand_blocks(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Expand contiguous blocks, given by their start indices and lengths, into an
+    array of the indices in the blocks.
+
+    Parameters:
+        starts: Start index of each block.
+        lengths: Number of indices in each block.
+
+    Returns:
+        Concatenation of ``np.arange(starts[i], starts[i] + lengths[i])`` over all
+        blocks.
+
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    out = np.empty(lengths.sum(), dtype=np.int64)
+    _fill_blocks(starts, lengths, out)
+    return out
+
+
+@numba.njit(cache=True)
+def _fill_blocks(starts, lengths, out):
+    """Helper function for numba acceleration of _expand_blocks.
+
+    Fills out with the indices of the blocks in a single pass.
+
+    """
+    pos = 0
+    for i in range(starts.size):
+        for j in range(lengths[i]):
+            out[pos] = starts[i] + j
+            pos += 1
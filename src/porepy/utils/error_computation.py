@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import logging
 import warnings
-from typing import Callable, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 
+import numba
 import numpy as np
+import scipy.sparse as sps
 
 import porepy as pp
 
@@ -43,80 +46,160 @@ def grid_error(
     assert len(variable) == len(variable_dof), (
         "Each variable must have associated " "with it a number of degrees of freedom."
     )
-    n_variables = len(variable)
-
-    errors: Dict = {}
 
     grids = mdg.subdomains()
     grids_ref = mdg_ref.subdomains()
-    n_grids = len(grids)
-
-    for i in np.arange(n_grids):
-        g, g_ref = grids[i], grids_ref[i]
-        mapping = mdg.subdomain_data(g)["coarse_fine_cell_mapping"]
-
-        # Get time step solutions
-        data = mdg.subdomain_data(g)
-        data_ref = mdg_ref.subdomain_data(g_ref)
-        solutions = data[pp.TIME_STEP_SOLUTIONS]
-        solutions_ref = data_ref[pp.TIME_STEP_SOLUTIONS]
-        node_number = data["node_number"]
-
-        # Initialize errors
-        errors[node_number] = {}
-
-        for var_idx in range(0, n_variables):
-            var = variable[var_idx]
-            var_dof = variable_dof[var_idx]
-
-            # Check if the variable exists on both the grid and reference grid
-            solution_keys = set(solutions.keys())
-            solution_ref_keys = set(solutions_ref.keys())
-            check_keys = solution_keys.intersection(solution_ref_keys)
-            if var not in check_keys:
-                logger.info(
-                    f"{var} not present on grid number "
-                    f"{node_number} of dim {g.dim}."
-                )
-                continue
-
-            # Compute errors relative to the reference grid
-            # TODO: Should the solution be divided by g.cell_volumes or similar?
-            # TODO: If scaling is used, consider that - or use the export-ready variables,
-            #   'u_exp', 'p_exp', etc.
-            sol = (
-                solutions[var][0].reshape((var_dof, -1), order="F").T
-            )  # (num_cells x var_dof)
-            mapped_sol: np.ndarray = mapping.dot(sol)  # (num_cells x variable_dof)
-            sol_ref = (
-                solutions_ref[var][0].reshape((var_dof, -1), order="F").T
-            )  # (num_cells x var_dof)
-
-            # axis=0 gives component-wise norm.
-            absolute_error = np.linalg.norm(mapped_sol - sol_ref, axis=0)
-
-            norm_ref = np.linalg.norm(sol_ref)
-            if np.any(norm_ref < 1e-10):
-                logger.info(
-                    f"Relative error not reportable. "
-                    f"Norm of reference state is {norm_ref}. "
-                    f"Reporting absolute error"
-                )
-                error = absolute_error
-                is_relative = False
-            else:
-                error = absolute_error / norm_ref
-                is_relative = True
-
-            errors[node_number][var] = {
-                "error": error,
-                "is_relative": is_relative,
-            }
+
+    # The subdomains are independent. The work per subdomain is dominated by sparse
+    # and dense array operations, which release the GIL, thus threads are used.
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(
+                _subdomain_errors,
+                g,
+                mdg.subdomain_data(g),
+                mdg_ref.subdomain_data(g_ref),
+                variable,
+                variable_dof,
+            )
+            for g, g_ref in zip(grids, grids_ref)
+        ]
+        # Errors are collected in the order of the subdomains.
+        errors: Dict = dict(future.result() for future in futures)
 
     return errors
 
 
-def interpolate(g: pp.GridLike, fun: Callable):
+def _subdomain_errors(
+    g: pp.Grid,
+    data: dict,
+    data_ref: dict,
+    variable: List[str],
+    variable_dof: List[int],
+) -> tuple[int, dict]:
+    """Compute the errors on a single subdomain, see grid_error.
+
+    Parameters:
+        g: "Coarse" subdomain grid.
+        data: Data dictionary of the coarse subdomain.
+        data_ref: Data dictionary of the corresponding "fine" subdomain.
+        variable: List defining which variables to compute error over.
+        variable_dof: List specifying the number of degrees of freedom for each variable
+            in the list 'variable'.
+
+    Returns:
+        Node number of the subdomain, and dictionary with the error of each variable.
+
+    """
+    mapping = data["coarse_fine_cell_mapping"]
+
+    # Get time step solutions
+    solutions = data[pp.TIME_STEP_SOLUTIONS]
+    solutions_ref = data_ref[pp.TIME_STEP_SOLUTIONS]
+    node_number = data["node_number"]
+
+    # Initialize errors
+    errors: Dict = {}
+
+    # The variables which exist on both the grid and reference grid
+    check_keys = solutions.keys() & solutions_ref.keys()
+
+    # Variables present on both grids, with their number of dofs
+    present: List[tuple[str, int]] = []
+    for var, var_dof in zip(variable, variable_dof):
+        if var not in check_keys:
+            logger.info(
+                f"{var} not present on grid number {node_number} of dim {g.dim}."
+            )
+            continue
+        present.append((var, var_dof))
+
+    if len(present) == 0:
+        return node_number, errors
+
+    # Compute errors relative to the reference grid
+    # TODO: Should the solution be divided by g.cell_volumes or similar?
+    # TODO: If scaling is used, consider that - or use the export-ready variables,
+    #   'u_exp', 'p_exp', etc.
+    # Stack the components of all variables column-wise, so that the solutions of
+    # all variables are mapped to the reference grid by a single product. The
+    # components of each cell are contiguous, thus the reshape gives a view.
+    sol = np.hstack(
+        [solutions[var][0].reshape((-1, var_dof)) for var, var_dof in present]
+    )  # (num_cells x sum of var_dof)
+    # If each fine cell is mapped from exactly one coarse cell with unit weight, which
+    # is the case for nested refinement, the mapping reduces to a gather.
+    coarse_cells = _coarse_cell_of_fine_cells(mapping)
+    if coarse_cells is not None:
+        mapped_sol: np.ndarray = sol[coarse_cells]  # (num_cells x sum of var_dof)
+    else:
+        mapped_sol = mapping.dot(sol)
+    sol_ref = np.hstack(
+        [solutions_ref[var][0].reshape((-1, var_dof)) for var, var_dof in present]
+    )  # (num_cells x sum of var_dof)
+
+    # Component-wise squared norm. The squares are summed over the cells by einsum,
+    # which avoids the temporary array of squares. Square roots are only taken of
+    # the final errors.
+    # The mapped solution is a temporary array, thus its memory is reused for the
+    # difference.
+    diff = np.subtract(mapped_sol, sol_ref, out=mapped_sol)
+    absolute_errors_sq = np.einsum("ij,ij->j", diff, diff)
+
+    # Columns of each variable in the stacked arrays
+    offsets = np.cumsum([0] + [var_dof for _, var_dof in present])
+
+    for (var, _), start, end in zip(present, offsets[:-1], offsets[1:]):
+        absolute_error_sq = absolute_errors_sq[start:end]
+
+        var_sol_ref = sol_ref[:, start:end]
+        norm_ref_sq = np.einsum("ij,ij->", var_sol_ref, var_sol_ref)
+        # Equivalent to the norm of the reference state being below 1e-10.
+        if norm_ref_sq < 1e-20:
+            logger.info(
+                f"Relative error not reportable. "
+                f"Norm of reference state is {np.sqrt(norm_ref_sq)}. "
+                f"Reporting absolute error"
+            )
+            error = np.sqrt(absolute_error_sq)
+            is_relative = False
+        else:
+            error = np.sqrt(absolute_error_sq / norm_ref_sq)
+            is_relative = True
+
+        errors[var] = {
+            "error": error,
+            "is_relative": is_relative,
+        }
+
+    return node_number, errors
+
+
+def _coarse_cell_of_fine_cells(mapping: sps.spmatrix) -> Optional[np.ndarray]:
+    """Identify coarse-to-fine mappings which copy coarse cell values to fine cells.
+
+    Parameters:
+        mapping: Coarse-to-fine cell mapping, with one row per fine cell and one
+            column per coarse cell.
+
+    Returns:
+        If each row of the mapping has a single nonzero equal to one, the column index
+        of the nonzero of each row, i.e., the coarse cell of each fine cell. Else None.
+
+    """
+    num_rows = mapping.shape[0]
+    if mapping.nnz != num_rows:
+        return None
+    coo = mapping.tocoo()
+    # Each row should have a single nonzero, equal to one.
+    if np.any(coo.data != 1) or np.any(np.bincount(coo.row, minlength=num_rows) != 1):
+        return None
+    coarse_cells = np.empty(num_rows, dtype=int)
+    coarse_cells[coo.row] = coo.col
+    return coarse_cells
+
+
+def interpolate(g: pp.GridLike, fun: Callable, vectorized: bool = False):
     """
     Interpolate a scalar or vector function on the cell centers of the grid.
 
@@ -126,6 +209,14 @@ def interpolate(g: pp.GridLike, fun: Callable):
         Grid, or a subclass, with geometry fields computed.
     fun : function
         Scalar or vector function.
+    vectorized : bool, default False
+        If False, fun is called once per cell center. If True, fun is called once
+        with all cell centers, an array of shape (3, g.num_cells), and should return
+        values for all cells. This is only valid if fun acts entry-wise on the
+        coordinates; reductions over the coordinates of a point, e.g. norms or sums,
+        would then run over all cells and give wrong values without notice. If the
+        function does not support array input, or the returned values do not have
+        one entry per cell, fun is instead called once per cell center.
 
     Return
     ------
@@ -144,11 +235,21 @@ def interpolate(g: pp.GridLike, fun: Callable):
     u_ex = interpolate(g, fun_u)
 
     """
+    if vectorized:
+        try:
+            out = np.asarray(fun(g.cell_centers))
+        except (TypeError, ValueError):
+            # The function does not operate on arrays, e.g., due to use of the math
+            # module or of branching on the coordinates.
+            pass
+        else:
+            if out.ndim > 0 and out.shape[-1] == g.num_cells:
+                return out
 
     return np.array([fun(pt) for pt in g.cell_centers.T]).T
 
 
-def norm_L2(g: pp.GridLike, val: np.ndarray):
+def norm_L2(g: pp.GridLike, val: np.ndarray) -> float:
     """
     Compute the L2 norm of a scalar or vector field.
 
@@ -161,7 +262,7 @@ def norm_L2(g: pp.GridLike, val: np.ndarray):
 
     Return
     ------
-    out: double
+    out: float
         The L2 norm of the input field.
 
     Examples
@@ -173,11 +274,15 @@ def norm_L2(g: pp.GridLike, val: np.ndarray):
 
     """
 
-    val = np.asarray(val)
-    norm_sq = lambda v: np.sum(np.multiply(np.square(v), g.cell_volumes))
-    if val.ndim == 1:
-        return np.sqrt(norm_sq(val))
-    return np.sqrt(np.sum([norm_sq(v) for v in val]))
+    # Treat scalar fields as vector fields with one component.
+    val = np.atleast_2d(np.asarray(val))
+    if val.dtype != np.float64:
+        # Other types, e.g., complex fields, are not supported by the compiled kernel.
+        # The squares are summed over cells and components by einsum instead.
+        return np.sqrt(np.einsum("ij,ij,j->", val, val, g.cell_volumes))
+    # The squaring, weighting with the cell volumes and summation over cells and
+    # components are done in a single pass, without temporary arrays.
+    return float(np.sqrt(_norm_l2_kernel(val, g.cell_volumes)))
 
 
 def l2_error(
@@ -187,7 +292,7 @@ def l2_error(
     is_scalar: bool,
     is_cc: bool,
     relative: bool = False,
-) -> pp.number:
+) -> float:
     """Compute discrete L2-error as given in [1].
 
     It is possible to compute the absolute error (default) or the relative error.
@@ -230,15 +335,137 @@ def l2_error(
         assert isinstance(grid, pp.Grid)  # to please mypy
         meas = grid.face_areas
 
-    if not is_scalar:
-        meas = meas.repeat(grid.dim)
+    # Vector quantities are stored cell-wise (or face-wise), i.e., the components of
+    # each element are contiguous. Arrange them as one row per element, so that each
+    # row is weighted by the measure of the element. This avoids repeating the
+    # measure for each component.
+    num_components = 1 if is_scalar else grid.dim
+    shape = (meas.size, num_components)
+
+    true_array = true_array.reshape(shape)
+    approx_array = approx_array.reshape(shape)
 
     # Obtain numerator and denominator to determine the error.
-    numerator = np.sqrt(np.sum(meas * np.abs(true_array - approx_array) ** 2))
-    denominator = np.sqrt(np.sum(meas * np.abs(true_array) ** 2)) if relative else 1.0
+    if np.iscomplexobj(true_array) or np.iscomplexobj(approx_array):
+        numerator_sq = _weighted_sum_of_squares(true_array - approx_array, meas)
+        denominator_sq = _weighted_sum_of_squares(true_array, meas) if relative else 1.0
+    elif relative:
+        # Compute both sums in a single pass over the arrays.
+        numerator_sq, denominator_sq = _l2_kernel_relative(
+            true_array, approx_array, meas
+        )
+    else:
+        numerator_sq = _l2_kernel_absolute(true_array, approx_array, meas)
+        denominator_sq = 1.0
+    numerator = np.sqrt(numerator_sq)
+    denominator = np.sqrt(denominator_sq)
 
     # Deal with the case when the denominator is zero when computing the relative error.
-    if np.isclose(denominator, 0):
+    # The denominator is non-negative; this is equivalent to np.isclose(denominator, 0)
+    # with the default tolerance, without the array machinery.
+    if denominator <= 1e-8:
         raise ZeroDivisionError("Attempted division by zero.")
 
-    return numerator / denominator
+    return float(numerator / denominator)
+
+
+def _weighted_sum_of_squares(values: np.ndarray, weights: np.ndarray) -> pp.number:
+    """Compute the sum of the squared absolute values, with each row weighted by the
+    given weights.
+
+    The squaring, weighting and summation are fused in a single call, without
+    temporary arrays.
+
+    Parameters:
+        values: Real or complex array of shape ``(num_rows, num_components)``.
+        weights: Weights, one per row of ``values``.
+
+    Returns:
+        The weighted sum ``sum(weights[:, None] * abs(values) ** 2)``.
+
+    """
+    if np.iscomplexobj(values):
+        return np.einsum("ij,ij,i->", values.conj(), values, weights).real
+    # For real values, the square is non-negative, thus no absolute value is needed.
+    return np.einsum("ij,ij,i->", values, values, weights)
+
+
+@numba.njit(parallel=True, cache=True)
+def _l2_kernel_absolute(true_array, approx_array, meas):
+    """Helper function for numba acceleration of l2_error.
+
+    Computes the squared numerator of the absolute L2-error of real arrays in a single
+    pass, without temporary copies of the arrays. The arrays are read in their own
+    precision, e.g., single precision arrays are not converted, while the arithmetic
+    and accumulation is done in double precision.
+
+    The rows are processed in parallel, and their contributions are summed in a fixed
+    order afterwards, such that the result does not depend on the number of threads.
+
+    Parameters:
+        true_array: True values, one row per cell (or face).
+        approx_array: Approximate values, same shape as true_array.
+        meas: Measure of each cell (or face).
+
+    Returns:
+        Weighted sum of the squares of the difference.
+
+    """
+    num_rows, num_components = true_array.shape
+    numerator_sq = np.zeros(num_rows)
+    for i in numba.prange(num_rows):
+        weight = np.float64(meas[i])
+        for j in range(num_components):
+            diff = np.float64(true_array[i, j]) - approx_array[i, j]
+            numerator_sq[i] += weight * diff * diff
+    return np.sum(numerator_sq)
+
+
+@numba.njit(parallel=True, cache=True)
+def _l2_kernel_relative(true_array, approx_array, meas):
+    """Helper function for numba acceleration of l2_error.
+
+    Computes the squared numerator and denominator of the relative L2-error of real
+    arrays in a single pass. See _l2_kernel_absolute for details.
+
+    Parameters:
+        true_array: True values, one row per cell (or face).
+        approx_array: Approximate values, same shape as true_array.
+        meas: Measure of each cell (or face).
+
+    Returns:
+        Weighted sums of the squares of the difference and of the true values.
+
+    """
+    num_rows, num_components = true_array.shape
+    numerator_sq = np.zeros(num_rows)
+    denominator_sq = np.zeros(num_rows)
+    for i in numba.prange(num_rows):
+        weight = np.float64(meas[i])
+        for j in range(num_components):
+            true_value = np.float64(true_array[i, j])
+            diff = true_value - approx_array[i, j]
+            numerator_sq[i] += weight * diff * diff
+            denominator_sq[i] += weight * true_value * true_value
+    return np.sum(numerator_sq), np.sum(denominator_sq)
+
+
+@numba.njit(cache=True)
+def _norm_l2_kernel(val, cell_volumes):
+    """Helper function for numba acceleration of norm_L2.
+
+    Parameters:
+        val: Field values, one row per component.
+        cell_volumes: Volume of each cell.
+
+    Returns:
+        Squared L2 norm of the field.
+
+    """
+    norm_sq = 0.0
+    num_components, num_cells = val.shape
+    for i in range(num_components):
+        for j in range(num_cells):
+            value = val[i, j]
+            norm_sq += value * value * cell_volumes[j]
+    return norm_sq
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numba
 import numpy as np
 
 import porepy as pp
@@ -109,7 +110,8 @@ def sort_multiple_point_pairs(lines: np.ndarray) -> np.ndarray:
     but stripped down to the special case of circular chains. Differently to
     sort_point_pairs, this variant sorts an arbitrary amount of independent
     point pairs. The chains are restricted by the assumption that each contains
-    equally many line segments. Finally, this routine uses numba.
+    equally many line segments. Finally, this routine uses numba, and the chains are
+    sorted in parallel.
 
     Parameters:
         lines (np.ndarray): Array of size 2 * num_chains x num_lines_per_chain,
@@ -119,85 +121,116 @@ def sort_multiple_point_pairs(lines: np.ndarray) -> np.ndarray:
 
     Returns:
         np.ndarray: Sorted version of lines, where for each chain, the collection
-            of l
+            of line segments has been potentially flipped and sorted. The array has
+            the same dtype as lines, i.e., it is of integer type for node indices.
 
-    Raises:
-        ImportError ifine segments has been potentially flipped and sorted.
     """
+    if lines.shape[1] == 4:
+        # Quadrilaterals are by far the most common non-simplex cells, and are sorted
+        # by a specialized kernel without temporary arrays.
+        return _sort_quad_point_pairs_numba(lines)
+    return _sort_multiple_point_pairs_numba(lines)
 
-    try:
-        import numba
-    except ImportError:
-        raise ImportError("Numba not available on the system")
-
-    @numba.njit("f8[:,:](i4[:,:])", cache=True)
-    def _function_to_compile(lines):
-        """
-        Copy of pp.utils.sort_points.sort_point_pairs. This version is extended
-        to multiple chains. Each chain is implicitly assumed to be circular.
-        """
-
-        # Retrieve number of chains and lines per chain from the shape.
-        # Implicitly expect that all chains have the same length
-        num_chains, chain_length = lines.shape
-        # Since for each chain lines includes two rows, divide by two
-        num_chains = int(num_chains / 2)
-
-        # Initialize array of sorted lines to be the final output
-        sorted_lines = np.zeros((2 * num_chains, chain_length))
-        # Fix the first line segment for each chain and identify
-        # it as in place regarding the sorting.
-        sorted_lines[:, 0] = lines[:, 0]
-        # Keep track of which lines have been fixed and which are still candidates
-        found = np.zeros(chain_length)
-        found[0] = 1
-
-        # Loop over chains and consider each chain separately.
-        for c in range(num_chains):
-            # Initialize found making any line segment aside of the first a candidate
-            found[1:] = 0
-
-            # Define the end point of the previous and starting point for the next
-            # line segment
-            prev = sorted_lines[2 * c + 1, 0]
-
-            # The sorting algorithm: Loop over all positions in the chain to be set next.
-            # Find the right candidate to be moved to this position and possibly flipped
-            # if needed. A candidate is identified as fitting if it contains one point
-            # equal to the current starting point. This algorithm uses a double loop,
-            # which is the most naive approach. However, assume chain_length is in
-            # general small.
-            for i in range(1, chain_length):  # The first line has already been found
-                for j in range(
-                    1, chain_length
-                ):  # The first line has already been found
-                    # A candidate line segment with matching start and end point
-                    # in the first component of the point pair.
-                    if np.abs(found[j]) < 1e-6 and lines[2 * c, j] == prev:
-                        # Copy the segment to the right place
-                        sorted_lines[2 * c : 2 * c + 2, i] = lines[2 * c : 2 * c + 2, j]
-                        # Mark as used
-                        found[j] = 1
-                        # Define the starting point for the next line segment
-                        prev = lines[2 * c + 1, j]
-                        break
-                    # A candidate line segment with matching start and end point
-                    # in the second component of the point pair.
-                    elif np.abs(found[j]) < 1e-6 and lines[2 * c + 1, j] == prev:
-                        # Flip and copy the segment to the right place
-                        sorted_lines[2 * c, i] = lines[2 * c + 1, j]
-                        sorted_lines[2 * c + 1, i] = lines[2 * c, j]
-                        # Mark as used
-                        found[j] = 1
-                        # Define the starting point for the next line segment
-                        prev = lines[2 * c, j]
-                        break
-
-        # Return the sorted lines defining chains.
-        return sorted_lines
-
-    # Run numba compiled function
-    return _function_to_compile(lines)
+
+@numba.njit(cache=True, parallel=True, boundscheck=False)
+def _sort_multiple_point_pairs_numba(lines):
+    """
+    Copy of pp.utils.sort_points.sort_point_pairs. This version is extended
+    to multiple chains. Each chain is implicitly assumed to be circular.
+    """
+
+    # Retrieve number of chains and lines per chain from the shape.
+    # Implicitly expect that all chains have the same length
+    num_chains, chain_length = lines.shape
+    # Since for each chain lines includes two rows, divide by two
+    num_chains = num_chains // 2
+
+    # Initialize array of sorted lines to be the final output. All entries are
+    # assigned below, and the node indices keep the integer type of the input.
+    sorted_lines = np.empty((2 * num_chains, chain_length), dtype=lines.dtype)
+    # Fix the first line segment for each chain and identify
+    # it as in place regarding the sorting.
+    sorted_lines[:, 0] = lines[:, 0]
+
+    # Loop over chains and consider each chain separately. The chains are
+    # independent, and are thus sorted in parallel.
+    for c in numba.prange(num_chains):
+        # The sorting algorithm: In a circular chain, each point occurs in exactly two
+        # line segments. Identify, for each occurrence of a point, the other
+        # occurrence of the same point. Occurrences are numbered 2 * j + k, referring
+        # to the k-th point of the j-th line segment. Sorting the points brings the
+        # two occurrences of each point next to each other. This replaces a search
+        # over all candidate segments for each position in the chain.
+        points = np.empty(2 * chain_length, dtype=lines.dtype)
+        for j in range(chain_length):
+            points[2 * j] = lines[2 * c, j]
+            points[2 * j + 1] = lines[2 * c + 1, j]
+        order = np.argsort(points)
+        other_occurrence = np.empty(2 * chain_length, dtype=np.int64)
+        for k in range(chain_length):
+            other_occurrence[order[2 * k]] = order[2 * k + 1]
+            other_occurrence[order[2 * k + 1]] = order[2 * k]
+
+        # Walk along the chain, starting from the end point of the first segment,
+        # which has already been fixed.
+        current = 1
+        for i in range(1, chain_length):
+            # The next segment is the other one containing the current end point
+            next_occurrence = other_occurrence[current]
+            j = next_occurrence // 2
+            if next_occurrence % 2 == 0:
+                # The end point is the first point of the next segment. Copy the
+                # segment to the right place, and continue from its second point.
+                sorted_lines[2 * c, i] = lines[2 * c, j]
+                sorted_lines[2 * c + 1, i] = lines[2 * c + 1, j]
+                current = 2 * j + 1
+            else:
+                # The end point is the second point of the next segment. Flip and copy
+                # the segment to the right place, and continue from its first point.
+                sorted_lines[2 * c, i] = lines[2 * c + 1, j]
+                sorted_lines[2 * c + 1, i] = lines[2 * c, j]
+                current = 2 * j
+
+    # Return the sorted lines defining chains.
+    return sorted_lines
+
+
+@numba.njit(cache=True, parallel=True, boundscheck=False)
+def _sort_quad_point_pairs_numba(lines):
+    """
+    Variant of _sort_multiple_point_pairs_numba specialized to chains of four line
+    segments. The placed segments are tracked in a bit mask, and each position in
+    the chain is found by at most three comparisons.
+    """
+    num_chains = lines.shape[0] // 2
+    # Zero-fill, such that positions of chains which cannot be closed are defined.
+    sorted_lines = np.zeros_like(lines)
+
+    for c in numba.prange(num_chains):
+        # Fix the first line segment, and continue from its second point.
+        sorted_lines[2 * c, 0] = lines[2 * c, 0]
+        sorted_lines[2 * c + 1, 0] = lines[2 * c + 1, 0]
+        prev = lines[2 * c + 1, 0]
+        placed = 1
+
+        for i in range(1, 4):
+            for j in range(1, 4):
+                if placed & (1 << j):
+                    continue
+                if lines[2 * c, j] == prev:
+                    sorted_lines[2 * c, i] = lines[2 * c, j]
+                    sorted_lines[2 * c + 1, i] = lines[2 * c + 1, j]
+                    prev = lines[2 * c + 1, j]
+                    placed |= 1 << j
+                    break
+                elif lines[2 * c + 1, j] == prev:
+                    sorted_lines[2 * c, i] = lines[2 * c + 1, j]
+                    sorted_lines[2 * c + 1, i] = lines[2 * c, j]
+                    prev = lines[2 * c, j]
+                    placed |= 1 << j
+                    break
+
+    return sorted_lines
 
 
 def sort_point_plane(
@@ -4,15 +4,18 @@ Module for data IO from and to vtu format via meshio.
 """
 from __future__ import annotations
 
+import hashlib
 import os
 import sys
 import xml.etree.ElementTree as ET
 from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import meshio
 import numpy as np
+import scipy.sparse as sps
 from deepdiff import DeepDiff
 
 import porepy as pp
@@ -26,6 +29,10 @@ Field = namedtuple("Field", ["name", "values"])
 Meshio_Geom = namedtuple("Meshio_Geom", ["pts", "connectivity", "cell_ids"])
 MD_Meshio_Geom = Dict[int, Union[None, Meshio_Geom]]
 
+# Buffer size used when writing pvd files; large enough to hold the file for typical
+# time series, such that the content reaches the disk in few system calls.
+_PVD_BUFFER_SIZE = 1 << 20
+
 # All allowed data structures to define data for exporting
 DataInput = Union[
     # Keys for states
@@ -79,6 +86,15 @@ class Exporter:
                 data) for many time steps (default True); note, however, that the
                 mesh is exported to each vtu file, which may also require
                 significant amount of storage.
+            reorder_cells (boolean): controlling whether the cells of each cell type
+                are reordered along a space-filling (Morton) curve through the cell
+                centers, improving the memory locality of the exported meshes when
+                processed in ParaView (default False).
+            background_writes (boolean): controlling whether vtu files are written
+                by a worker thread, such that the data of the next file can be
+                assembled while the previous one is written to disk. The worker is
+                started when needed and released once all files of a call to
+                write_vtu are written (default False).
 
     Raises:
         TypeError: If grid has other type than :class:`~pp.grids.grid.Grid` or
@@ -146,6 +162,12 @@ class Exporter:
         )
         """Flag controlling whether constant data is exported to a separate file."""
 
+        self._reorder_cells: bool = kwargs.pop("reorder_cells", False)
+        """Flag controlling whether cells are exported in Morton order."""
+
+        self._background_writes: bool = kwargs.pop("background_writes", False)
+        """Flag controlling whether vtu files are written by a worker thread."""
+
         self._length_scale: float = length_scale
         """Length scale for the grid. All coordinates are multiplied by this value
         before exporting.
@@ -174,6 +196,11 @@ class Exporter:
         self.m_meshio_geom: MD_Meshio_Geom = dict()
         """Dictionary storing the meshio representation of the mortar grids."""
 
+        self._meshio_geom_cache: dict[tuple[bool, int], tuple[bytes, Meshio_Geom]] = {}
+        """Meshio representations of previously exported grids, identified by whether
+        they are mortar grids and their dimension, together with a fingerprint of the
+        grids they were built from."""
+
         # Generate geometrical information in meshio format
         self._update_meshio_geom()
         self._update_constant_mesh_data()
@@ -211,6 +238,17 @@ class Exporter:
         """Identifier for whether constant interface data has been assigned to
         Exporter."""
 
+        # Infrastructure for writing vtu files in the background.
+
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        """Single worker writing vtu files, such that the data of the next dimension can
+        be assembled while previous ones are written to disk. Only used if background
+        writes are activated, started when needed and released by
+        :meth:`_wait_for_writes`."""
+
+        self._pending_writes: list[Future] = []
+        """Handles of vtu files submitted to the worker but not confirmed written."""
+
         # Misc
 
         self._padding = 6
@@ -265,24 +303,24 @@ class Exporter:
             # corresponding to that time step. Utilize hardcoded format in
             # Exporter.write_pvd().
 
-            # Collect all timesteps first listed in the pvd file, and sort them.
-            timesteps = []
+            # Collect the attributes of all data sets listed in the pvd file in a
+            # single pass over the XML tree.
             # Use the ET package from the standard library to parse the XML-file.
             tree_pvd = ET.parse(pvd_file)
-            for path in tree_pvd.iter("DataSet"):
-                data = path.attrib
-                timesteps.append(data["timestep"])
-            unique_timesteps = np.unique(timesteps)
+            datasets = [path.attrib for path in tree_pvd.iter("DataSet")]
+
+            # Collect all timesteps first listed in the pvd file, and sort them.
+            unique_timesteps = np.unique([data["timestep"] for data in datasets])
 
             # Pick the last time step. NOTE: Possibility to extend to multiple times.
             restart_timestep_str = unique_timesteps[-1]
 
             # Collect all vtu files connected to the identified time step.
-            for path in tree_pvd.iter("DataSet"):
-                data = path.attrib
-                timestep = data["timestep"]
-                if timestep == restart_timestep_str:
-                    restart_vtu_files.append(data["file"])
+            restart_vtu_files.extend(
+                data["file"]
+                for data in datasets
+                if data["timestep"] == restart_timestep_str
+            )
 
             # Identify the time_index from the content of the pvd file.
             time_index = int(float(restart_timestep_str))
@@ -488,6 +526,11 @@ class Exporter:
                     # dimensionality in each cell.
                     value = np.concatenate(tuple(vtu_data.cell_data[key]), axis=0)
 
+                    # Undo the grouping of cells by type and a possible reordering of
+                    # cells, restoring the order of the cells in the grids.
+                    cell_order = np.concatenate(meshio_geometry.cell_ids)
+                    value[cell_order] = value.copy()
+
                     # Chop data in pieces compatible with the subdomains and interfaces
                     offset = 0
                     if is_subdomain_data:
@@ -677,6 +720,9 @@ class Exporter:
             self._has_interface_data = True
             self._export_data_vtu(interface_data, time_step, interface_data=True)
 
+        # Make sure all vtu files are on disk before returning to the caller.
+        self._wait_for_writes()
+
         # Export mixed-dimensional grid to pvd format
         file_name = self._make_file_name(self._file_name, time_step, extension=".pvd")
         file_name = self._append_folder_name(self._folder_name, file_name)
@@ -742,7 +788,12 @@ class Exporter:
             and len(self._exported_timesteps_constants) > 0
         )
         if include_constant_data:
-            indices = [self._exported_timesteps.index(e) for e in file_extension]
+            # Map each time step to its first position, to avoid a linear search per
+            # time step.
+            position: dict[int, int] = {}
+            for i, e in enumerate(self._exported_timesteps):
+                position.setdefault(e, i)
+            indices = [position[e] for e in file_extension]
             file_extension_constants = [
                 self._exported_timesteps_constants[i] for i in indices
             ]
@@ -785,76 +836,57 @@ class Exporter:
         # of the header.
         footer = "</Collection>\n" + "</VTKFile>"
 
-        # Open the file and write the header to file
-        o_file = open(pvd_file, "w")
-        o_file.write(header)
+        # Collect the content of the file, starting with the header, and write it at
+        # once in the end.
+        parts: list[str] = [header]
 
         # Define main body
         fm = '\t<DataSet group="" part="" timestep="%f" file="%s"/>\n'
 
         # Perform the same procedure as in _export_mdg_pvd but looping over all
-        # designated time steps. Gather all data, and assign the actual time.
+        # designated time steps. Gather all data, and assign the actual time. The file
+        # names depend on the time step only through a suffix. Thus, determine the time
+        # independent prefixes, including the dimension, once for all time steps.
+        prefixes = [
+            self._make_file_name(self._file_name, dim=dim, extension="")
+            for dim in self._dims
+            if self._has_subdomain_data and self.meshio_geom[dim] is not None
+        ] + [
+            self._make_file_name(self._file_name + "_mortar", dim=dim, extension="")
+            for dim in self._m_dims
+            if self._has_interface_data and self.m_meshio_geom[dim] is not None
+        ]
         for time, fn in zip(times, file_extension):
-            # Go through all possible data types, analogously to _export_mdg_pvd.
-
-            # Subdomain data
-            for dim in self._dims:
-                if self._has_subdomain_data and self.meshio_geom[dim] is not None:
-                    o_file.write(
-                        fm % (time, self._make_file_name(self._file_name, fn, dim))
-                    )
-
-            # Interface data.
-            for dim in self._m_dims:
-                if self._has_interface_data and self.m_meshio_geom[dim] is not None:
-                    o_file.write(
-                        fm
-                        % (
-                            time,
-                            self._make_file_name(self._file_name + "_mortar", fn, dim),
-                        )
-                    )
+            suffix = self._make_file_name("", fn)
+            parts.extend(fm % (time, prefix + suffix) for prefix in prefixes)
 
         # Optionally, do the same for constant data.
         if include_constant_data:
+            prefixes_constants = [
+                self._make_file_name(
+                    self._file_name + "_constant", dim=dim, extension=""
+                )
+                for dim in self._dims
+                if self._has_constant_subdomain_data
+                and self.meshio_geom[dim] is not None
+            ] + [
+                self._make_file_name(
+                    self._file_name + "_constant_mortar", dim=dim, extension=""
+                )
+                for dim in self._m_dims
+                if self._has_constant_interface_data
+                and self.m_meshio_geom[dim] is not None
+            ]
             for time, fn_constants in zip(times, file_extension_constants):
-                # Constant subdomain data.
-                for dim in self._dims:
-                    if (
-                        self._has_constant_subdomain_data
-                        and self.meshio_geom[dim] is not None
-                    ):
-                        o_file.write(
-                            fm
-                            % (
-                                time,
-                                self._make_file_name(
-                                    self._file_name + "_constant", fn_constants, dim
-                                ),
-                            )
-                        )
-
-                # Constant interface data.
-                for dim in self._m_dims:
-                    if (
-                        self._has_constant_interface_data
-                        and self.m_meshio_geom[dim] is not None
-                    ):
-                        o_file.write(
-                            fm
-                            % (
-                                time,
-                                self._make_file_name(
-                                    self._file_name + "_constant_mortar",
-                                    fn_constants,
-                                    dim,
-                                ),
-                            )
-                        )
+                suffix = self._make_file_name("", fn_constants)
+                parts.extend(
+                    fm % (time, prefix + suffix) for prefix in prefixes_constants
+                )
 
-        # End with footer and close the file
-        o_file.write(footer)
-        o_file.close()
+        # End with footer and write the file
+        parts.append(footer)
+        with open(pvd_file, "w", buffering=_PVD_BUFFER_SIZE) as o_file:
+            o_file.write("".join(parts))
 
     # Some auxiliary routines used in write_vtu()
 
@@ -922,6 +954,11 @@ class Exporter:
 
             return value
 
+        # Fetch the subdomains and interfaces with their data dictionaries once, to be
+        # traversed for each key provided as string.
+        subdomains_and_data = self._mdg.subdomains(return_data=True)
+        interfaces_and_data = self._mdg.interfaces(return_data=True, codim=1)
+
         def add_data_from_str(
             data_pt: str, subdomain_data: dict, interface_data: dict
         ) -> tuple[dict, dict, bool]:
@@ -958,14 +995,10 @@ class Exporter:
                     grid_data: dict,
                     export_data: dict,
                 ) -> bool:
-                    if (
-                        pp.TIME_STEP_SOLUTIONS in grid_data
-                        and key in grid_data[pp.TIME_STEP_SOLUTIONS]
-                    ):
+                    solutions = grid_data.get(pp.TIME_STEP_SOLUTIONS)
+                    if solutions is not None and key in solutions:
                         # Fetch data and convert to vectorial format if needed
-                        value: np.ndarray = _to_vector_format(
-                            grid_data[pp.TIME_STEP_SOLUTIONS][key][0], grid
-                        )
+                        value: np.ndarray = _to_vector_format(solutions[key][0], grid)
 
                         # Add data point in correct format to the collection
                         export_data[(grid, key)] = value
@@ -976,12 +1009,12 @@ class Exporter:
                         return False
 
                 # Check data associated to subdomain field data
-                for sd, sd_data in self._mdg.subdomains(return_data=True):
+                for sd, sd_data in subdomains_and_data:
                     if _add_data(key, sd, sd_data, subdomain_data):
                         has_key = True
 
                 # Check data associated to interface field data
-                for intf, intf_data in self._mdg.interfaces(return_data=True, codim=1):
+                for intf, intf_data in interfaces_and_data:
                     if _add_data(key, intf, intf_data, interface_data):
                         has_key = True
 
@@ -1361,17 +1394,26 @@ class Exporter:
         if not hasattr(self, "_constant_subdomain_data"):
             self._constant_subdomain_data = dict()
 
+        # Subdomains are not associated to any side of a mortar grid
+        none_side = pp.grids.mortar_grid.MortarSides.NONE_SIDE.value
+
         # Add mesh related, constant subdomain data by direct assignment
         for sd, sd_data in self._mdg.subdomains(return_data=True):
-            ones = np.ones(sd.num_cells, dtype=int)
+            num_cells = sd.num_cells
             self._constant_subdomain_data[(sd, "cell_id")] = np.arange(
-                sd.num_cells, dtype=int
+                num_cells, dtype=np.int32
+            )
+            self._constant_subdomain_data[(sd, "grid_dim")] = np.full(
+                num_cells, sd.dim, dtype=np.int32
+            )
+            self._constant_subdomain_data[(sd, "subdomain_id")] = np.full(
+                num_cells, sd.id, dtype=np.int32
+            )
+            self._constant_subdomain_data[(sd, "is_mortar")] = np.zeros(
+                num_cells, dtype=np.int32
             )
-            self._constant_subdomain_data[(sd, "grid_dim")] = sd.dim * ones
-            self._constant_subdomain_data[(sd, "subdomain_id")] = sd.id * ones
-            self._constant_subdomain_data[(sd, "is_mortar")] = 0 * ones
-            self._constant_subdomain_data[(sd, "mortar_side")] = (
-                pp.grids.mortar_grid.MortarSides.NONE_SIDE.value * ones
+            self._constant_subdomain_data[(sd, "mortar_side")] = np.full(
+                num_cells, none_side, dtype=np.int32
             )
 
         # Define constant interface data related to the mesh
@@ -1383,14 +1425,20 @@ class Exporter:
         # Add mesh related, constant interface data by direct assignment.
         for intf, intf_data in self._mdg.interfaces(return_data=True, codim=1):
             # Construct empty arrays for all extra interface data
-            self._constant_interface_data[(intf, "grid_dim")] = np.empty(0, dtype=int)
-            self._constant_interface_data[(intf, "cell_id")] = np.empty(0, dtype=int)
+            self._constant_interface_data[(intf, "grid_dim")] = np.empty(
+                0, dtype=np.int32
+            )
+            self._constant_interface_data[(intf, "cell_id")] = np.empty(
+                0, dtype=np.int32
+            )
             self._constant_interface_data[(intf, "interface_id")] = np.empty(
-                0, dtype=int
+                0, dtype=np.int32
+            )
+            self._constant_interface_data[(intf, "is_mortar")] = np.empty(
+                0, dtype=np.int32
             )
-            self._constant_interface_data[(intf, "is_mortar")] = np.empty(0, dtype=int)
             self._constant_interface_data[(intf, "mortar_side")] = np.empty(
-                0, dtype=int
+                0, dtype=np.int32
             )
 
             # Initialize offset
@@ -1398,18 +1446,25 @@ class Exporter:
 
             # Assign extra interface data by collecting values on both sides.
             for side, grid in intf.side_grids.items():
-                ones = np.ones(grid.num_cells, dtype=int)
+                num_cells = grid.num_cells
 
                 # Grid dimension of the mortar grid
                 self._constant_interface_data[(intf, "grid_dim")] = np.hstack(
-                    (self._constant_interface_data[(intf, "grid_dim")], grid.dim * ones)
+                    (
+                        self._constant_interface_data[(intf, "grid_dim")],
+                        np.full(num_cells, grid.dim, dtype=np.int32),
+                    )
                 )
 
                 # Cell ids of the mortar grid
                 self._constant_interface_data[(intf, "cell_id")] = np.hstack(
                     (
                         self._constant_interface_data[(intf, "cell_id")],
-                        np.arange(grid.num_cells, dtype=int) + side_grid_num_cells,
+                        np.arange(
+                            side_grid_num_cells,
+                            side_grid_num_cells + num_cells,
+                            dtype=np.int32,
+                        ),
                     )
                 )
 
@@ -1417,25 +1472,28 @@ class Exporter:
                 self._constant_interface_data[(intf, "interface_id")] = np.hstack(
                     (
                         self._constant_interface_data[(intf, "interface_id")],
-                        intf.id * ones,
+                        np.full(num_cells, intf.id, dtype=np.int32),
                     )
                 )
 
                 # Whether the interface is mortar
                 self._constant_interface_data[(intf, "is_mortar")] = np.hstack(
-                    (self._constant_interface_data[(intf, "is_mortar")], ones)
+                    (
+                        self._constant_interface_data[(intf, "is_mortar")],
+                        np.ones(num_cells, dtype=np.int32),
+                    )
                 )
 
                 # Side of the mortar
                 self._constant_interface_data[(intf, "mortar_side")] = np.hstack(
                     (
                         self._constant_interface_data[(intf, "mortar_side")],
-                        side.value * ones,
+                        np.full(num_cells, side.value, dtype=np.int32),
                     )
                 )
 
                 # Update offset
-                side_grid_num_cells += grid.num_cells
+                side_grid_num_cells += num_cells
 
     def _export_data_vtu(
         self,
@@ -1486,12 +1544,17 @@ class Exporter:
         # Append folder name to file name base
         file_name_base = self._append_folder_name(self._folder_name, file_name_base)
 
-        # Collect unique keys, and for unique sorting, sort by alphabet
-        keys = list(set([key for _, key in data]))
-        keys.sort()
+        # Collect the unique keys present on each dimension in a single pass over the
+        # data. This avoids searching for keys on dimensions without data for them.
+        keys_of_dim: dict[int, set[str]] = {}
+        for entity, key in data:
+            keys_of_dim.setdefault(entity.dim, set()).add(key)
 
         # Collect the data and extra data in a single stack for each dimension
         for dim in dims:
+            # Keys present on this dimension; for unique sorting, sort by alphabet
+            keys = sorted(keys_of_dim.get(dim, set()))
+
             # Define the full file name
             file_name: str = self._make_file_name(file_name_base, time_step, dim)
 
@@ -1504,11 +1567,13 @@ class Exporter:
             # Construct the list of fields represented on this dimension.
             fields: list[Field] = []
             for key in keys:
-                # Collect the values associated to all entities
-                values = []
-                for e in entities:
-                    if (e, key) in data:
-                        values.append(data[(e, key)])
+                # Collect the values associated to all entities, with a single lookup
+                # per entity.
+                values = [
+                    value
+                    for value in (data.get((e, key)) for e in entities)
+                    if value is not None
+                ]
 
                 # Require data for all or none entities of that dimension.
                 if len(values) not in [0, len(entities)]:
@@ -1518,9 +1583,10 @@ class Exporter:
                     )
 
                 # If data has been found, append data to list after stacking values
-                # for different entities
+                # for different entities. Cells run along the last axis, for both
+                # scalar and vector valued data.
                 if values:
-                    field = Field(key, np.hstack(values))
+                    field = Field(key, np.concatenate(values, axis=-1))
                     fields.append(field)
 
             # Print data for the particular dimension. Since geometric info is required
@@ -1529,7 +1595,38 @@ class Exporter:
                 self.meshio_geom[dim] if is_subdomain_data else self.m_meshio_geom[dim]
             )
             if meshio_geom is not None:
-                self._write(fields, file_name, meshio_geom)
+                if not self._background_writes:
+                    self._write(fields, file_name, meshio_geom)
+                    continue
+
+                # The field values are freshly stacked arrays, hence owned by the
+                # writer, and the geometry is only ever replaced, not modified. It is
+                # thus safe to write in the background. A single worker is used, since
+                # meshio is not known to be thread-safe; files are hence written one
+                # after another, overlapping only with the assembly of further data.
+                if self._io_pool is None:
+                    self._io_pool = ThreadPoolExecutor(max_workers=1)
+                self._pending_writes.append(
+                    self._io_pool.submit(self._write, fields, file_name, meshio_geom)
+                )
+
+    def _wait_for_writes(self) -> None:
+        """Block until all vtu files submitted for writing are on disk, and release the
+        worker.
+
+        Exceptions raised while writing are propagated to the caller.
+
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        try:
+            for future in pending:
+                future.result()
+        finally:
+            # Wait for the remaining files also if one of them failed, such that no
+            # worker thread outlives this call.
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
 
     def _export_mdg_pvd(self, file_name: str, time_step: Optional[int]) -> None:
         """Routine to export to pvd format and collect all data scattered over several
@@ -1540,10 +1637,7 @@ class Exporter:
             time_step: used as appendix for the file name.
 
         """
-        # Open the file
-        o_file = open(file_name, "w")
-
-        # Write VTK header to file
+        # Define VTK header
         b = "LittleEndian" if sys.byteorder == "little" else "BigEndian"
         c = ' compressor="vtkZLibDataCompressor"'
         header = (
@@ -1552,18 +1646,19 @@ class Exporter:
             + 'byte_order="%s"%s>\n' % (b, c)
             + "<Collection>\n"
         )
-        o_file.write(header)
+        # Collect the content of the file, and write it at once in the end.
+        parts: list[str] = [header]
         fm = '\t<DataSet group="" part="" file="%s"/>\n'
 
         # Subdomain data.
         for dim in self._dims:
             if self._has_subdomain_data and self.meshio_geom[dim] is not None:
-                o_file.write(fm % self._make_file_name(self._file_name, time_step, dim))
+                parts.append(fm % self._make_file_name(self._file_name, time_step, dim))
 
         # Interface data.
         for dim in self._m_dims:
             if self._has_interface_data and self.m_meshio_geom[dim] is not None:
-                o_file.write(
+                parts.append(
                     fm
                     % self._make_file_name(self._file_name + "_mortar", time_step, dim)
                 )
@@ -1578,7 +1673,7 @@ class Exporter:
                     self._has_constant_subdomain_data
                     and self.meshio_geom[dim] is not None
                 ):
-                    o_file.write(
+                    parts.append(
                         fm
                         % self._make_file_name(
                             self._file_name + "_constant",
@@ -1593,7 +1688,7 @@ class Exporter:
                     self._has_constant_interface_data
                     and self.m_meshio_geom[dim] is not None
                 ):
-                    o_file.write(
+                    parts.append(
                         fm
                         % self._make_file_name(
                             self._file_name + "_constant_mortar",
@@ -1602,8 +1697,9 @@ class Exporter:
                         )
                     )
 
-        o_file.write("</Collection>\n" + "</VTKFile>")
-        o_file.close()
+        parts.append("</Collection>\n" + "</VTKFile>")
+        with open(file_name, "w", buffering=_PVD_BUFFER_SIZE) as o_file:
+            o_file.write("".join(parts))
 
     def _update_meshio_geom(self) -> None:
         """Manager for storing the grid information in meshio format.
@@ -1618,7 +1714,7 @@ class Exporter:
             # Get subdomains with dimension dim
             subdomains = self._mdg.subdomains(dim=dim)
             # Export and store
-            self.meshio_geom[dim] = self._export_grid(subdomains, dim)
+            self.meshio_geom[dim] = self._cached_export_grid(subdomains, dim, False)
 
         # Interfaces
         for dim in self._m_dims:
@@ -1629,7 +1725,116 @@ class Exporter:
                 for _, grid in intf.side_grids.items()
             ]
             # Export and store
-            self.m_meshio_geom[dim] = self._export_grid(interface_side_grids, dim)
+            self.m_meshio_geom[dim] = self._cached_export_grid(
+                interface_side_grids, dim, True
+            )
+
+    def _cached_export_grid(
+        self, grids: list[pp.Grid], dim: int, is_mortar: bool
+    ) -> Union[None, Meshio_Geom]:
+        """Export grids of dimension dim to meshio format, reusing the result of a
+        previous export if the grids are unchanged.
+
+        The grids are identified by a fingerprint of their node coordinates and their
+        cell-face and face-node relations, which fully determine the meshio
+        representation. Hence moved nodes or changed topology trigger a new export.
+
+        Parameters:
+            grids: Subdomains or mortar side grids of same dimension.
+            dim: Dimension of the grids.
+            is_mortar: Whether the grids are mortar grids.
+
+        Returns:
+            Meshio_Geom: Points, cells (storing the connectivity), and cell ids in
+                correct meshio format.
+
+        """
+        fingerprint = hashlib.blake2b(digest_size=16)
+        for grid in grids:
+            for array in (
+                grid.nodes,
+                grid.cell_faces.indptr,
+                grid.cell_faces.indices,
+                grid.face_nodes.indptr,
+                grid.face_nodes.indices,
+            ):
+                fingerprint.update(np.ascontiguousarray(array).data)
+            # Separate the grids, such that the partitioning into grids is reflected.
+            fingerprint.update(b"|")
+        digest = fingerprint.digest()
+
+        cached = self._meshio_geom_cache.get((is_mortar, dim))
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        meshio_geom = self._reorder_meshio_cells(self._export_grid(grids, dim))
+        if meshio_geom is not None:
+            self._meshio_geom_cache[(is_mortar, dim)] = (digest, meshio_geom)
+        return meshio_geom
+
+    def _reorder_meshio_cells(
+        self, meshio_geom: Union[None, Meshio_Geom]
+    ) -> Union[None, Meshio_Geom]:
+        """Reorder the cells of each cell block along a Morton curve, if requested.
+
+        The cells are sorted by the Morton code of their centers, approximated by the
+        mean of their nodes. The cell ids are permuted accordingly, such that data is
+        still associated to the right cells. Blocks without a fixed number of nodes per
+        cell (polyhedra) are left untouched.
+
+        Parameters:
+            meshio_geom: Points, connectivity and cell ids in meshio format.
+
+        Returns:
+            The reordered meshio representation, or the input if reordering is not
+            requested.
+
+        """
+        if not self._reorder_cells or meshio_geom is None:
+            return meshio_geom
+
+        pts = meshio_geom.pts
+        # Quantize coordinates relative to the bounding box with 21 bits per direction,
+        # such that the interleaved code fits into 64 bits.
+        min_coord = pts.min(axis=0)
+        extent = np.maximum(pts.max(axis=0) - min_coord, np.finfo(float).tiny)
+        max_int = 2**21 - 1
+
+        def _spread_bits(x: np.ndarray) -> np.ndarray:
+            # Insert two zero bits between each of the lowest 21 bits of x.
+            x = x.astype(np.uint64)
+            for shift, mask in (
+                (32, 0x1F00000000FFFF),
+                (16, 0x1F0000FF0000FF),
+                (8, 0x100F00F00F00F00F),
+                (4, 0x10C30C30C30C30C3),
+                (2, 0x1249249249249249),
+            ):
+                x = (x | (x << np.uint64(shift))) & np.uint64(mask)
+            return x
+
+        connectivity: list[meshio.CellBlock] = []
+        cell_ids: list[np.ndarray] = []
+        for block, ids in zip(meshio_geom.connectivity, meshio_geom.cell_ids):
+            data = block.data
+            if not (isinstance(data, np.ndarray) and data.ndim == 2):
+                connectivity.append(block)
+                cell_ids.append(ids)
+                continue
+
+            centers = pts[data].mean(axis=1)
+            q = ((centers - min_coord) / extent * max_int).astype(np.uint64)
+            code = (
+                _spread_bits(q[:, 0])
+                | (_spread_bits(q[:, 1]) << np.uint64(1))
+                | (_spread_bits(q[:, 2]) << np.uint64(2))
+            )
+            order = np.argsort(code, kind="stable")
+
+            connectivity.append(meshio.CellBlock(block.type, data[order]))
+            cell_ids.append(np.asarray(ids)[order])
+
+        return Meshio_Geom(pts, connectivity, cell_ids)
 
     def _export_grid(
         self, grids: Iterable[pp.Grid], dim: int
@@ -1676,22 +1881,29 @@ class Exporter:
         # In 1d each cell is a line
         cell_type = "line"
 
-        # Dictionary storing cell->nodes connectivity information
-        cell_to_nodes: dict[str, np.ndarray] = {cell_type: np.empty((0, 2), dtype=int)}
-
         # Dictionary collecting all cell ids for each cell type. Since each cell is a
         # line, the list of cell ids is trivial
         total_num_cells = np.sum(np.array([grid.num_cells for grid in grids]))
-        cell_id: dict[str, list[int]] = {cell_type: [i for i in range(total_num_cells)]}
+        cell_id: dict[str, np.ndarray] = {cell_type: np.arange(total_num_cells)}
+
+        # The connectivity is stored with 32 bit integers.
+        assert sum(grid.num_nodes for grid in grids) < 2**31
+
+        # Dictionary storing cell->nodes connectivity information. The connectivity of
+        # all grids is filled into a preallocated array.
+        cell_to_nodes: dict[str, np.ndarray] = {
+            cell_type: np.empty((total_num_cells, 2), dtype=np.int32)
+        }
 
         # Data structure for storing node coordinates of all 1d grids.
         num_pts = np.sum([grid.num_nodes for grid in grids]).astype(int)
         meshio_pts = np.empty((num_pts, 3))  # type: ignore
 
-        # Initialize offset. All data associated to 1d grids is stored in the same vtu
+        # Initialize offsets. All data associated to 1d grids is stored in the same vtu
         # file, essentially using concatenation. To identify each grid, keep track of
-        # number of nodes for each grid.
+        # number of nodes and cells for each grid.
         nodes_offset = 0
+        cell_offset = 0
 
         # Loop over all 1d grids
         for grid in grids:
@@ -1703,12 +1915,12 @@ class Exporter:
             cn_indices = self._simplex_cell_to_nodes(1, grid)
 
             # Add to previous connectivity information
-            cell_to_nodes[cell_type] = np.vstack(
-                (cell_to_nodes[cell_type], cn_indices + nodes_offset)
-            )
+            cell_sl = slice(cell_offset, cell_offset + grid.num_cells)
+            np.add(cn_indices, nodes_offset, out=cell_to_nodes[cell_type][cell_sl])
 
             # Update offsets
             nodes_offset += grid.num_nodes
+            cell_offset += grid.num_cells
 
         # Construct the meshio data structure
         meshio_cells = list()
@@ -1717,14 +1929,46 @@ class Exporter:
         # For each cell_type store the connectivity pattern cell_to_nodes for the
         # corresponding cells with ids from cell_id.
         for cell_type, cell_block in cell_to_nodes.items():
-            meshio_cells.append(meshio.CellBlock(cell_type, cell_block.astype(int)))
-            meshio_cell_id.append(np.array(cell_id[cell_type]))
+            meshio_cells.append(
+                meshio.CellBlock(cell_type, cell_block.astype(np.int32, copy=False))
+            )
+            meshio_cell_id.append(cell_id[cell_type])
 
         # Return final meshio data: points, cell (connectivity), cell ids
         return Meshio_Geom(meshio_pts, meshio_cells, meshio_cell_id)
 
+    def _stack_connectivity(
+        self, blocks: list[np.ndarray], nodes_offsets: list[int]
+    ) -> np.ndarray:
+        """Stack the cell-node connectivity of several grids.
+
+        The node indices of each block are shifted by the node offset of its grid,
+        in a single pass over the stacked array.
+
+        Parameters:
+            blocks: cell-node connectivity of each grid, in local node numbering.
+            nodes_offsets: node offset of each grid in the joint node numbering.
+
+        Returns:
+            Stacked cell-node connectivity in the joint node numbering.
+
+        """
+        cell_to_nodes = np.concatenate(blocks, axis=0)
+        # For a single grid, all offsets vanish.
+        if any(nodes_offsets):
+            offsets = np.repeat(
+                np.array(nodes_offsets, dtype=cell_to_nodes.dtype),
+                [block.shape[0] for block in blocks],
+            )
+            cell_to_nodes += offsets[:, None]
+        return cell_to_nodes
+
     def _simplex_cell_to_nodes(
-        self, n: int, grid: pp.Grid, cells: Optional[np.ndarray] = None
+        self,
+        n: int,
+        grid: pp.Grid,
+        cells: Optional[np.ndarray] = None,
+        cell_nodes: Optional[sps.csc_matrix] = None,
     ) -> np.ndarray:
         """Determine cell to node connectivity for a general n-simplex mesh.
 
@@ -1732,29 +1976,38 @@ class Exporter:
             n: dimension of the simplices in the grid.
             grid: grid containing cells and nodes.
             cells: all n-simplex cells.
+            cell_nodes: cell-node relation of the grid, if already available to the
+                caller. Constructed from the grid if not provided.
 
         Returns:
             np.ndarray: cell to node connectivity array, in which for each row
             (associated to cells) all associated nodes are marked.
 
         """
-        # Determine cell-node ptr
-        cn_indptr = (
-            grid.cell_nodes().indptr[:-1]
-            if cells is None
-            else grid.cell_nodes().indptr[cells]
-        )
+        # The cell-node relation is constructed on each call, thus fetch it only once.
+        if cell_nodes is None:
+            cell_nodes = grid.cell_nodes()
 
         # Each n-simplex has n+1 nodes
         num_nodes = n + 1
 
-        # Collect the indptr to all nodes of the cell.
-        expanded_cn_indptr = np.vstack(
-            [cn_indptr + i for i in range(num_nodes)]
-        ).reshape(-1, order="F")
+        # Any n-dimensional cell has at least n+1 nodes. If the total number of
+        # cell-node pairs matches, all cells of the grid are simplices, and the indices
+        # can be used directly with a fixed stride.
+        if cell_nodes.indices.size == num_nodes * grid.num_cells:
+            cn_indices = cell_nodes.indices.reshape((-1, num_nodes))
+            return cn_indices if cells is None else cn_indices[cells]
+
+        # Determine cell-node ptr
+        cn_indptr = (
+            cell_nodes.indptr[:-1] if cells is None else cell_nodes.indptr[cells]
+        )
+
+        # Collect the indptr to all nodes of the cell, cell by cell.
+        expanded_cn_indptr = (cn_indptr[:, None] + np.arange(num_nodes)).ravel()
 
         # Detect all corresponding nodes by applying the expanded mask to the indices
-        expanded_cn_indices = grid.cell_nodes().indices[expanded_cn_indptr]
+        expanded_cn_indices = cell_nodes.indices[expanded_cn_indptr]
 
         # Convert to right format.
         cn_indices = np.reshape(expanded_cn_indices, (-1, num_nodes), order="C")
@@ -1781,9 +2034,13 @@ class Exporter:
         # Dictionary storing cell->nodes connectivity information for all cell types.
         # For this, the nodes have to be sorted such that they form a circular chain,
         # describing the boundary of the cell.
-        cell_to_nodes: dict[str, np.ndarray] = {}
+        # The connectivity of each grid is collected per cell type, and stacked once all
+        # grids are processed.
+        cell_to_nodes_blocks: dict[str, list[np.ndarray]] = {}
+        # Node offsets of the grids, for each block of connectivity.
+        nodes_offsets: dict[str, list[int]] = {}
         # Dictionary collecting all cell ids for each cell type.
-        cell_id: dict[str, list[int]] = {}
+        cell_id: dict[str, list[np.ndarray]] = {}
 
         # Data structure for storing node coordinates of all 2d grids.
         num_pts = np.sum([grid.num_nodes for grid in grids])
@@ -1801,46 +2058,41 @@ class Exporter:
             sl = slice(nodes_offset, nodes_offset + grid.num_nodes)
             meshio_pts[sl, :] = grid.nodes.T * self._length_scale
 
-            # Determine cell types based on number of nodes.
-            num_nodes_per_cell = grid.cell_nodes().getnnz(axis=0)
-
-            # Loop over all available cell types and group cells of one type.
-            g_cell_map = dict()
-            for n in np.unique(num_nodes_per_cell):
+            # Determine cell types based on number of nodes. The cell-node relation is
+            # constructed on each call, thus fetch it only once.
+            cell_nodes = grid.cell_nodes()
+            num_nodes_per_cell = cell_nodes.getnnz(axis=0)
+
+            # Group the cells by their number of nodes, using a single stable sort.
+            # Within each group, the cells remain in ascending order.
+            sort_ind = np.argsort(num_nodes_per_cell, kind="stable")
+            counts = np.bincount(num_nodes_per_cell)
+            starts = np.cumsum(counts) - counts
+
+            # Loop over all available cell types, and determine cell ids and cell-node
+            # connectivity for each type. Treat triangle, quad and polygonal cells
+            # differently aiming for optimized performance.
+            for n in np.flatnonzero(counts):
                 # Define cell type; check if it coincides with a predefined cell type
                 cell_type = polygon_map.get(f"polygon{n}", f"polygon{n}")
 
-                # Find all cells with n nodes, and store for later use
-                cells = np.nonzero(num_nodes_per_cell == n)[0]
-                g_cell_map[cell_type] = cells
-
-                # Store cell ids in global container; init if entry not yet established
-                if cell_type not in cell_id:
-                    cell_id[cell_type] = []
+                # Fetch all cells with n nodes
+                cells = sort_ind[starts[n] : starts[n] + counts[n]]
 
-                # Add offset taking into account previous grids
-                cell_id[cell_type] += (cells + cell_offset).tolist()
-
-            # Determine cell-node connectivity for each cell type and all cells. Treat
-            # triangle, quad and polygonal cells differently aiming for optimized
-            # performance.
-            for n in np.unique(num_nodes_per_cell):
-                # Define the cell type
-                cell_type = polygon_map.get(f"polygon{n}", f"polygon{n}")
-
-                # Check if cell_type is already defined in cell_to_nodes, otherwise
-                # construct it
-                if cell_type not in cell_to_nodes:
-                    cell_to_nodes[cell_type] = np.empty((0, n), dtype=int)
+                # Store cell ids in global container, adding offset taking into account
+                # previous grids.
+                cell_id.setdefault(cell_type, []).append(cells + cell_offset)
 
                 # Special case: Triangle cells, i.e., n=3.
                 if cell_type == "triangle":
                     # Triangles are simplices and have a trivial connectivity.
-
-                    # Fetch triangle cells
-                    cells = g_cell_map[cell_type]
                     # Determine the trivial connectivity - triangles are 2-simplices.
-                    cn_indices = self._simplex_cell_to_nodes(2, grid, cells)
+                    # For purely triangular grids, this is a reshape of the indices,
+                    # without the need to select cells.
+                    all_cells = counts[n] == grid.num_cells
+                    cn_indices = self._simplex_cell_to_nodes(
+                        2, grid, None if all_cells else cells, cell_nodes
+                    )
 
                 # Quad and polygon cells.
                 else:
@@ -1861,53 +2113,47 @@ class Exporter:
                     # faces,such that they form a circular graph, and then choose the
                     # resulting starting points of all faces to define the connectivity.
 
-                    # Fetch corresponding cells
-                    cells = g_cell_map[cell_type]
                     # Determine all faces of all cells. Use an analogous approach as
                     # used to determine all cell nodes for triangle cells. And use that
                     # a polygon with n nodes has also n faces.
                     cf_indptr = grid.cell_faces.indptr[cells]
-                    expanded_cf_indptr = np.vstack(
-                        [cf_indptr + i for i in range(n)]
-                    ).reshape(-1, order="F")
+                    expanded_cf_indptr = (cf_indptr[:, None] + np.arange(n)).ravel()
                     cf_indices = grid.cell_faces.indices[expanded_cf_indptr]
 
                     # Determine the associated (two) nodes of all faces for each cell.
-                    fn_indptr = grid.face_nodes.indptr[cf_indices]
-                    # Extract nodes for first and second node of each face; reshape such
-                    # that all first nodes of all faces for each cell are stored in one
-                    # row, i.e., end up with an array of size num_cells (for this cell
-                    # type) x n.
-                    cfn_indices = [
-                        grid.face_nodes.indices[fn_indptr + i].reshape(-1, n)
-                        for i in range(2)
-                    ]
-                    # Group first and second nodes, with alternating order of rows.
-                    # By this, each cell is represented by two rows. The first and
-                    # second rows contain first and second nodes of faces. And each
-                    # column stands for one face.
-                    cfn = np.ravel(cfn_indices, order="F").reshape(n, -1).T
+                    # In 2d each face has exactly two nodes, hence the indices of
+                    # face_nodes can be viewed as pairs, and gathered in one go.
+                    face_node_pairs = grid.face_nodes.indices.reshape(-1, 2)
+                    cf_pairs = face_node_pairs[cf_indices].reshape(-1, n, 2)
+                    # Group first and second nodes of all faces, with alternating order
+                    # of rows. By this, each cell is represented by two rows, each of
+                    # size n. The first and second rows contain first and second nodes
+                    # of faces. And each column stands for one face.
+                    cfn = cf_pairs.transpose(0, 2, 1).reshape(2 * cells.size, n)
 
                     # Sort faces for each cell such that they form a chain. Use a
                     # function compiled with Numba. This step is the bottleneck of
                     # this routine.
-                    cfn = pp.utils.sort_points.sort_multiple_point_pairs(cfn).astype(
-                        int
-                    )
+                    cfn = pp.utils.sort_points.sort_multiple_point_pairs(cfn)
 
                     # For each cell pick the sorted nodes such that they form a chain
                     # and thereby define the connectivity, i.e., skip every second row.
                     cn_indices = cfn[::2, :]
 
-                # Add offset to account for previous grids, and store
-                cell_to_nodes[cell_type] = np.vstack(
-                    (cell_to_nodes[cell_type], cn_indices + nodes_offset)
-                )
+                # Store, together with the offset to account for previous grids
+                cell_to_nodes_blocks.setdefault(cell_type, []).append(cn_indices)
+                nodes_offsets.setdefault(cell_type, []).append(nodes_offset)
 
             # Update offsets
             nodes_offset += grid.num_nodes
             cell_offset += grid.num_cells
 
+        # Stack the connectivity of all grids for each cell type.
+        cell_to_nodes: dict[str, np.ndarray] = {
+            cell_type: self._stack_connectivity(blocks, nodes_offsets[cell_type])
+            for cell_type, blocks in cell_to_nodes_blocks.items()
+        }
+
         # Construct the meshio data structure
         meshio_cells = list()
         meshio_cell_id = list()
@@ -1919,9 +2165,11 @@ class Exporter:
             # Thus, remove the number of nodes associated to polygons.
             cell_type_meshio_format = "polygon" if "polygon" in cell_type else cell_type
             meshio_cells.append(
-                meshio.CellBlock(cell_type_meshio_format, cell_block.astype(int))
+                meshio.CellBlock(
+                    cell_type_meshio_format, cell_block.astype(np.int32, copy=False)
+                )
             )
-            meshio_cell_id.append(np.array(cell_id[cell_type]))
+            meshio_cell_id.append(np.concatenate(cell_id[cell_type]))
 
         # Return final meshio data: points, cell (connectivity), cell ids
         return Meshio_Geom(meshio_pts, meshio_cells, meshio_cell_id)
@@ -1950,9 +2198,13 @@ class Exporter:
         for grid in grids:
             # The number of faces per cell wil be later used to determining
             # the cell types
-            num_faces_per_cell = np.unique(grid.cell_faces.getnnz(axis=0))
+            num_faces_per_cell = grid.cell_faces.getnnz(axis=0)
 
-            if num_faces_per_cell.shape[0] == 1:
+            # A single cell type requires all cells to have the same number of faces
+            if (
+                num_faces_per_cell.size > 0
+                and num_faces_per_cell.min() == num_faces_per_cell.max()
+            ):
                 n = num_faces_per_cell[0]
                 if n == 4:
                     cell_types.add("tetra")
@@ -1985,10 +2237,12 @@ class Exporter:
         """
         # For the special meshio geometric type "tetra", cell->nodes will be used to
         # store connectivity information. Each simplex has 4 nodes.
-        cell_to_nodes = np.empty((0, 4), dtype=int)
+        # The connectivity of all grids is collected and stacked once in the end.
+        cell_to_nodes_blocks: list[np.ndarray] = []
+        nodes_offsets: list[int] = []
 
-        # Dictionary collecting all cell ids for each cell type.
-        cell_id: list[int] = []
+        # List collecting the cell ids of all grids.
+        cell_id: list[np.ndarray] = []
 
         # Data structure for storing node coordinates of all 3d grids.
         num_pts = np.sum([grid.num_nodes for grid in grids])
@@ -2010,25 +2264,31 @@ class Exporter:
             cells = np.arange(grid.num_cells)
 
             # Add offset taking into account previous grids
-            cell_id += (cells + cell_offset).tolist()
+            cell_id.append(cells + cell_offset)
 
             # Determine local connectivity for all cells. Simplices are invariant under
             # permutations. Thus, no specific ordering of nodes is required. Tetrahedra
             # are essentially 3-simplices.
             cn_indices = self._simplex_cell_to_nodes(3, grid, cells)
 
-            # Store cell-node connectivity, and add offset taking into account previous
-            # grids
-            cell_to_nodes = np.vstack((cell_to_nodes, cn_indices + nodes_offset))
+            # Store cell-node connectivity, and the offset taking into account
+            # previous grids
+            cell_to_nodes_blocks.append(cn_indices)
+            nodes_offsets.append(nodes_offset)
 
             # Update offset
             nodes_offset += grid.num_nodes
             cell_offset += grid.num_cells
 
+        # Stack the connectivity of all grids.
+        cell_to_nodes = self._stack_connectivity(cell_to_nodes_blocks, nodes_offsets)
+
         # Initialize the meshio data structure for the connectivity and cell ids. There
         # is only one cell type, and meshio expects iterable data structs.
-        meshio_cells = [meshio.CellBlock("tetra", cell_to_nodes.astype(int))]
-        meshio_cell_id = [np.array(cell_id)]
+        meshio_cells = [
+            meshio.CellBlock("tetra", cell_to_nodes.astype(np.int32, copy=False))
+        ]
+        meshio_cell_id = [np.concatenate(cell_id)]
 
         # Return final meshio data: points, cell (connectivity), cell ids
         return Meshio_Geom(meshio_pts, meshio_cells, meshio_cell_id)
@@ -2051,10 +2311,12 @@ class Exporter:
         """
         # For the special meshio geometric type "hexahedron", cell->nodes will be used
         # to store connectivity information. Each hexahedron has 8 nodes.
-        cell_to_nodes = np.empty((0, 8), dtype=int)
+        # The connectivity of all grids is collected and stacked once in the end.
+        cell_to_nodes_blocks: list[np.ndarray] = []
+        nodes_offsets: list[int] = []
 
-        # Dictionary collecting all cell ids for each cell type.
-        cell_id: list[int] = []
+        # List collecting the cell ids of all grids.
+        cell_id: list[np.ndarray] = []
 
         # Data structure for storing node coordinates of all 3d grids.
         num_pts = np.sum([grid.num_nodes for grid in grids])
@@ -2074,7 +2336,7 @@ class Exporter:
             cells = np.arange(grid.num_cells)
 
             # Add offset taking into account previous grids
-            cell_id += (cells + cell_offset).tolist()
+            cell_id.append(cells + cell_offset)
 
             # Determine local connectivity for all cells. Simplices are invariant
             # under permutations. Thus, no specific ordering of nodes is required.
@@ -2095,9 +2357,7 @@ class Exporter:
 
             # Collect the indptr to all nodes of the cell; each n-simplex cell contains
             # n nodes
-            expanded_cn_indptr = np.vstack([cn_indptr + i for i in range(8)]).reshape(
-                -1, order="F"
-            )
+            expanded_cn_indptr = (cn_indptr[:, None] + np.arange(8)).ravel()
 
             # Detect all corresponding nodes by applying the expanded mask to indices
             expanded_cn_indices = grid.cell_nodes().indices[expanded_cn_indptr]
@@ -2112,18 +2372,24 @@ class Exporter:
             # Test whether the hard-coded numbering really defines a hexahedron.
             assert self._test_hex_meshio_format(grid.nodes, cn_indices)
 
-            # Store cell-node connectivity, and add offset taking into account previous
-            # grids
-            cell_to_nodes = np.vstack((cell_to_nodes, cn_indices + nodes_offset))
+            # Store cell-node connectivity, and the offset taking into account
+            # previous grids
+            cell_to_nodes_blocks.append(cn_indices)
+            nodes_offsets.append(nodes_offset)
 
             # Update offset
             nodes_offset += grid.num_nodes
             cell_offset += grid.num_cells
 
+        # Stack the connectivity of all grids.
+        cell_to_nodes = self._stack_connectivity(cell_to_nodes_blocks, nodes_offsets)
+
         # Initialize the meshio data structure for the connectivity and cell ids. There
         # is only one cell type, and meshio expects iterable data structs.
-        meshio_cells = [meshio.CellBlock("hexahedron", cell_to_nodes.astype(int))]
-        meshio_cell_id = [np.array(cell_id)]
+        meshio_cells = [
+            meshio.CellBlock("hexahedron", cell_to_nodes.astype(np.int32, copy=False))
+        ]
+        meshio_cell_id = [np.concatenate(cell_id)]
 
         # Return final meshio data: points, cell (connectivity), cell ids
         return Meshio_Geom(meshio_pts, meshio_cells, meshio_cell_id)
@@ -2258,7 +2524,7 @@ class Exporter:
         cell_to_faces: dict[str, list[list[int]]] = {}
 
         # Dictionary collecting all cell ids for each cell type.
-        cell_id: dict[str, list[int]] = {}
+        cell_id: dict[str, list[np.ndarray]] = {}
 
         # Data structure for storing node coordinates of all 3d grids.
         num_pts = np.sum([grid.num_nodes for grid in grids])
@@ -2278,55 +2544,62 @@ class Exporter:
             # will be treated separately allowing for using fitting datastructures.
             num_nodes_per_cell = grid.cell_nodes().getnnz(axis=0)
 
-            g_cell_map = dict()
-
-            for n in np.unique(num_nodes_per_cell):
+            # Group the cells by their number of nodes, using a single stable sort.
+            # Within each group, the cells remain in ascending order.
+            sort_ind = np.argsort(num_nodes_per_cell, kind="stable")
+            counts = np.bincount(num_nodes_per_cell)
+            starts = np.cumsum(counts) - counts
+
+            # Store shortcuts to cell-face and face-node information
+            cf_indptr = grid.cell_faces.indptr
+            cf_indices = grid.cell_faces.indices
+            fn_indptr = grid.face_nodes.indptr
+            fn_indices = grid.face_nodes.indices
+
+            # Determine cell ids and local connectivity for all cells. Due to different
+            # treatment of special and general cell types and to conform with array
+            # sizes (for polyhedra), treat each cell type separately.
+            for n in np.flatnonzero(counts):
                 cell_type = f"polyhedron{n}"
 
-                # Find all cells with n faces, and store for later use
-                cells = np.nonzero(num_nodes_per_cell == n)[0]
-                g_cell_map[cell_type] = cells
-
-                # Store cell ids in global container; init if entry not yet established
-                if cell_type not in cell_id:
-                    cell_id[cell_type] = []
+                # Fetch all cells with n nodes
+                cells = sort_ind[starts[n] : starts[n] + counts[n]]
 
-                # Add offset taking into account previous grids
-                cell_id[cell_type] += (cells + cell_offset).tolist()
+                # Store cell ids in global container, adding offset taking into account
+                # previous grids.
+                cell_id.setdefault(cell_type, []).append(cells + cell_offset)
 
-            # Determine local connectivity for all cells. Due to different treatment of
-            # special and general cell types and to conform with array sizes (for
-            # polyhedra), treat each cell type separately.
-            for cell_type in g_cell_map.keys():
                 # The general strategy is to define the connectivity as cell-face-nodes
                 # information, where the faces are defined by nodes. Hence, this
                 # information is significantly larger than the info provided for tetra
                 # cells. Here, we make use of the fact that grid.face_nodes provides
                 # nodes ordered wrt. the right-hand rule.
 
-                # Fetch cells with n faces
-                cells = g_cell_map[cell_type]
-
-                # Store shortcuts to cell-face and face-node information
-                cf_indptr = grid.cell_faces.indptr
-                cf_indices = grid.cell_faces.indices
-                fn_indptr = grid.face_nodes.indptr
-                fn_indices = grid.face_nodes.indices
-
                 # Determine the cell-face connectivity with faces described by their
                 # nodes ordered such that they form a chain and are identified by the
-                # face boundary. The final data format is a list[list[np.ndarray]]. The
-                # outer list loops over all cells. Each cell entry contains a list over
-                # faces, and each face entry is given by the face nodes.
-                if cell_type not in cell_to_faces:
-                    cell_to_faces[cell_type] = []
-                cell_to_faces[cell_type] += [
-                    [
-                        fn_indices[fn_indptr[f] : fn_indptr[f + 1]]  # nodes
-                        for f in cf_indices[cf_indptr[c] : cf_indptr[c + 1]]  # faces
-                    ]
-                    for c in cells  # cells
-                ]
+                # face boundary. Collect the faces of all cells, and the nodes of all
+                # these faces, as flat arrays, with offsets marking the start of each
+                # cell and face, respectively.
+                cf_starts, cf_ends = cf_indptr[cells], cf_indptr[cells + 1]
+                faces = cf_indices[pp.utils.mcolon.mcolon(cf_starts, cf_ends)]
+                fn_starts, fn_ends = fn_indptr[faces], fn_indptr[faces + 1]
+                nodes = (
+                    fn_indices[pp.utils.mcolon.mcolon(fn_starts, fn_ends)]
+                    + nodes_offset
+                )
+                face_starts = np.cumsum(cf_ends - cf_starts)[:-1]
+                node_starts = np.cumsum(fn_ends - fn_starts)[:-1]
+
+                # The final data format is a list[list[np.ndarray]]. The outer list
+                # loops over all cells. Each cell entry contains a list over faces, and
+                # each face entry is given by the face nodes. Split the flat arrays
+                # into this format in a single pass.
+                nodes_of_faces = np.split(nodes, node_starts)
+                bounds = np.concatenate(([0], face_starts, [faces.size]))
+                cell_to_faces.setdefault(cell_type, []).extend(
+                    nodes_of_faces[start:end]
+                    for start, end in zip(bounds[:-1], bounds[1:])
+                )
 
             # Update offset
             nodes_offset += grid.num_nodes
@@ -2340,7 +2613,7 @@ class Exporter:
         for cell_type, cell_block in cell_to_faces.items():
             # Adapt the block number taking into account of previous cell types.
             meshio_cells.append(meshio.CellBlock(cell_type, cell_block))
-            meshio_cell_id.append(np.array(cell_id[cell_type]))
+            meshio_cell_id.append(np.concatenate(cell_id[cell_type]))
 
         # Return final meshio data: points, cell (connectivity), cell ids
         return Meshio_Geom(meshio_pts, meshio_cells, meshio_cell_id)
@@ -2363,25 +2636,29 @@ class Exporter:
         # Initialize empty cell data dictionary
         cell_data: dict[str, list[np.ndarray]] = {}
 
-        # Split the data for each group of geometrically uniform cells. Utilize
+        # The cells of all groups of geometrically uniform cells, in the order of the
+        # groups, and the ranges of the groups within this ordering. Utilize
         # meshio_geom for this.
+        cell_order = np.concatenate(meshio_geom.cell_ids)
+        bounds = np.cumsum([0] + [ids.size for ids in meshio_geom.cell_ids])
+        ranges = [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+        # Split the data for each group of geometrically uniform cells.
         for field in fields:
             # Although technically possible, as implemented, field.values should never
             # be None.
             assert field.values is not None
 
-            # For each field create a sub-vector for each geometrically uniform group
-            # of cells
-            cell_data[field.name] = list()
-
-            # Fill up the data
-            for ids in meshio_geom.cell_ids:
-                if field.values.ndim == 1:
-                    cell_data[field.name].append(field.values[ids])
-                elif field.values.ndim == 2:
-                    cell_data[field.name].append(field.values[:, ids].T)
-                else:
-                    raise ValueError("Data values have wrong dimension")
+            # Reorder the cells of each field with a single gather, and create a view
+            # for each geometrically uniform group of cells. The shape of the values is
+            # checked once per field.
+            if field.values.ndim == 1:
+                values = field.values[cell_order]
+            elif field.values.ndim == 2:
+                values = field.values[:, cell_order].T
+            else:
+                raise ValueError("Data values have wrong dimension")
+            cell_data[field.name] = [values[sl] for sl in ranges]
 
         # Create the meshio object
         meshio_grid_to_export = meshio.Mesh(
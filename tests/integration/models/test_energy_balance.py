@@ -38,18 +38,15 @@ class BoundaryCondition(BoundaryConditionLinearPressure):
             Array of boundary values.
 
         """
-        # Define boundary regions
-        values = []
+        # Define boundary regions. Fill the values of all subdomains into a single
+        # array, addressing each subdomain through its face offset.
+        val = self.fluid.convert_units(1, "K")
+        bc_values = np.zeros(sum(sd.num_faces for sd in subdomains))
+        offset = 0
         for sd in subdomains:
             _, _, west, *_ = self.domain_boundary_sides(sd)
-            val_loc = np.zeros(sd.num_faces)
-            val_loc[west] = self.fluid.convert_units(1, "K")
-            values.append(val_loc)
-        # Concatenate to single array.
-        if len(values) > 0:
-            bc_values = np.hstack(values)
-        else:
-            bc_values = np.empty(0)
+            bc_values[offset : offset + sd.num_faces][west] = val
+            offset += sd.num_faces
         return pp.wrap_as_ad_array(bc_values, name="bc_values_fourier")
 
     def bc_type_fourier(self, sd: pp.Grid) -> pp.BoundaryCondition:
@@ -65,7 +62,7 @@ class BoundaryCondition(BoundaryConditionLinearPressure):
         # Define boundary regions
         _, east, west, *_ = self.domain_boundary_sides(sd)
         # Define Dirichlet conditions on the left and right boundaries
-        return pp.BoundaryCondition(sd, east + west, "dir")
+        return pp.BoundaryCondition(sd, east | west, "dir")
 
     def bc_values_enthalpy_flux(self, subdomains: list[pp.Grid]) -> pp.ad.DenseArray:
         """Boundary values for the enthalpy.
@@ -77,25 +74,24 @@ class BoundaryCondition(BoundaryConditionLinearPressure):
             Array with boundary values for the enthalpy.
 
         """
-        # List for all subdomains
-        values = []
-
-        # Loop over subdomains to collect boundary values
+        # The boundary value is the same for all subdomains.
+        temperature = self.fluid.convert_units(1, "K")
+        density = self.fluid.density()
+        mobility = 1 / self.fluid.viscosity()
+        val = self.fluid.specific_heat_capacity() * temperature * density * mobility
+
+        # Fill the values of all subdomains into a single array, addressing each
+        # subdomain through its face offset.
+        values = np.zeros(sum(sd.num_faces for sd in subdomains))
+        offset = 0
         for sd in subdomains:
             # Get enthalpy values on boundary faces applying trace to interior values.
             _, _, west, *_ = self.domain_boundary_sides(sd)
-            vals = np.zeros(sd.num_faces)
-            temperature = self.fluid.convert_units(1, "K")
-            density = self.fluid.density()
-            mobility = 1 / self.fluid.viscosity()
-            vals[west] = (
-                self.fluid.specific_heat_capacity() * temperature * density * mobility
-            )
-            # Append to list of boundary values
-            values.append(vals)
+            values[offset : offset + sd.num_faces][west] = val
+            offset += sd.num_faces
 
-        # Concatenate to single array and wrap as ad.DenseArray
-        bc_values = pp.wrap_as_ad_array(np.hstack(values), name="bc_values_enthalpy")
+        # Wrap as ad.DenseArray
+        bc_values = pp.wrap_as_ad_array(values, name="bc_values_enthalpy")
         return bc_values
 
 
@@ -174,14 +170,20 @@ def test_advection_or_diffusion_dominated(fluid_vals, solid_vals):
         # Advection dominated case.
         # Check that the enthalpy flux over each face is bounded by the value
         # corresponding to a fully saturated domain.
-        for sd in setup.mdg.subdomains():
-            val = setup.enthalpy_flux([sd]).evaluate(setup.equation_system).val
-            # Account for specific volume, default value of .01 in fractures.
-            normals = np.abs(sd.face_normals[0]) * np.power(0.1, setup.nd - sd.dim)
-            k = setup.solid.permeability() / setup.fluid.viscosity()
-            grad = 1 / setup.domain.bounding_box["xmax"]
-            enth = setup.fluid.specific_heat_capacity() * normals * grad * k
-            assert np.all(np.abs(val) < np.abs(enth) + 1e-10)
+        # Evaluate the flux on all subdomains at once.
+        subdomains = setup.mdg.subdomains()
+        val = setup.enthalpy_flux(subdomains).evaluate(setup.equation_system).val
+        # Account for specific volume, default value of .01 in fractures.
+        normals = np.hstack(
+            [
+                np.abs(sd.face_normals[0]) * 0.1 ** (setup.nd - sd.dim)
+                for sd in subdomains
+            ]
+        )
+        k = setup.solid.permeability() / setup.fluid.viscosity()
+        grad = 1 / setup.domain.bounding_box["xmax"]
+        enth = (setup.fluid.specific_heat_capacity() * grad * k) * normals
+        assert np.all(np.abs(val) < np.abs(enth) + 1e-10)
 
         # Total advected matrix energy: (bc_val=1) * specific_heat * (time=1 s) * (total
         # influx =grad * dp * k=1/2*k)
@@ -99,6 +99,41 @@ def test_boundary_sides(geometry_class, num_fracs):
             assert np.all(np.isclose(sd.face_centers[dim, side], box_min[dim]))
 
 
+@pytest.mark.parametrize("geometry_class", geometry_list)
+def test_boundary_sides_are_stored(geometry_class):
+    """The boundary sides are stored per subdomain, and recomputed when the geometry
+    changes."""
+    geometry = geometry_class()
+    geometry.params = {"fracture_indices": [0]}
+    geometry.units = pp.Units()
+    geometry.set_geometry()
+
+    sd = geometry.mdg.subdomains()[0]
+    sides = geometry.domain_boundary_sides(sd)
+    east = sides.east.copy()
+    # Modifying the returned arrays does not affect later calls.
+    sides.east[:] = np.logical_not(sides.east)
+    assert np.all(geometry.domain_boundary_sides(sd).east == east)
+    assert np.all(geometry.domain_boundary_sides(sd, tol=1e-8).east == east)
+
+    # Moving the face centers invalidates the stored sides.
+    sd.face_centers[0] += 1
+    assert not np.any(geometry.domain_boundary_sides(sd).east & east)
+    sd.face_centers[0] -= 1
+    assert np.all(geometry.domain_boundary_sides(sd).east == east)
+
+    # So does a change of the domain.
+    box = geometry.domain.bounding_box
+    box["xmax"] += 1
+    assert not np.any(geometry.domain_boundary_sides(sd).east)
+    box["xmax"] -= 1
+
+    # A new geometry gives the same sides for the new subdomain.
+    geometry.set_geometry()
+    new_sd = geometry.mdg.subdomains()[0]
+    assert np.all(geometry.domain_boundary_sides(new_sd).east == east)
+
+
 @pytest.mark.parametrize("geometry_class", geometry_list)
 # Only test up to two fractures here, that should suffice.
 @pytest.mark.parametrize("num_fracs", [0, 1, 2])
@@ -38,7 +38,7 @@ class BoundaryConditionLinearPressure:
         # Define boundary regions
         all_bf, east, west, *_ = self.domain_boundary_sides(sd)
         # Define Dirichlet conditions on the left and right boundaries
-        return pp.BoundaryCondition(sd, east + west, "dir")
+        return pp.BoundaryCondition(sd, east | west, "dir")
 
     def bc_values_darcy(self, subdomains: list[pp.Grid]) -> pp.ad.DenseArray:
         """Boundary values for the pressure.
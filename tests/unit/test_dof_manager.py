@@ -1,11 +1,14 @@
 """Test functionality of the ``DofManager``.
 
-The ``DofManager`` is on its way to be phased out. The only functionality tested here is
-the ``get_variable_values`` function, which was not working correctly.
+The ``DofManager`` is on its way to be phased out. Tested here are the
+``get_variable_values`` function, which was not working correctly, and the lookup
+between dofs and grid-variable blocks.
 
 """
 
 import numpy as np
+import pytest
+
 import porepy as pp
 
 
@@ -35,3 +38,71 @@ def test_get_variable_values() -> None:
 
     variable_values = dof_manager.get_variable_values(time_step_index=0)
     assert np.all(variable_values == np.full(mdg.subdomains()[0].num_cells, 0.0))
+
+
+def _dof_manager_with_fracture() -> pp.DofManager:
+    """DofManager for a 2d grid with a single fracture.
+
+    The subdomains carry a cell and a face variable, and a variable without any dofs.
+    The interface carries a cell variable.
+
+    """
+    mdg, _ = pp.md_grids_2d.single_horizontal([2, 2], simplex=False)
+    for _, data in mdg.subdomains(return_data=True):
+        data[pp.PRIMARY_VARIABLES] = {
+            "pressure": {"cells": 1},
+            "empty": {"cells": 0},
+            "flux": {"faces": 1},
+        }
+    for _, data in mdg.interfaces(return_data=True):
+        data[pp.PRIMARY_VARIABLES] = {"mortar_flux": {"cells": 1}}
+    return pp.DofManager(mdg)
+
+
+def test_grid_and_variable_to_slice() -> None:
+    """The slice of each block addresses the same dofs as the index array, also for
+    blocks without dofs."""
+    dof_manager = _dof_manager_with_fracture()
+    full = np.arange(dof_manager.num_dofs())
+    num_empty = 0
+    for grid, variable in dof_manager.block_dof:
+        dofs = dof_manager.grid_and_variable_to_dofs(grid, variable)
+        sl = dof_manager.grid_and_variable_to_slice(grid, variable)
+        assert np.all(full[sl] == dofs)
+        num_empty += dofs.size == 0
+    # Make sure that blocks without dofs, on all subdomains, are covered.
+    assert num_empty == len(dof_manager.mdg.subdomains())
+    assert len(dof_manager.mdg.interfaces()) > 0
+
+
+def test_dofs_to_grid_and_variable() -> None:
+    """The vectorized lookup agrees with the lookup of single dofs, and skips blocks
+    without dofs."""
+    dof_manager = _dof_manager_with_fracture()
+    inds = np.arange(dof_manager.num_dofs())
+    found = dof_manager.dofs_to_grid_and_variable(inds)
+    assert len(found) == inds.size
+    for ind, grid_and_variable in zip(inds, found):
+        assert grid_and_variable == dof_manager.dof_to_grid_and_variable(ind)
+        assert grid_and_variable[1] != "empty"
+        # The dof is part of the block it is assigned to.
+        assert ind in dof_manager.grid_and_variable_to_dofs(*grid_and_variable)
+
+    # Indices in arbitrary order, with repetitions.
+    shuffled = np.array([inds[-1], 0, inds[-1], inds.size // 2])
+    assert dof_manager.dofs_to_grid_and_variable(shuffled) == [
+        dof_manager.dof_to_grid_and_variable(i) for i in shuffled
+    ]
+
+
+@pytest.mark.parametrize("ind", [-1, "size"])
+def test_dof_lookup_out_of_range(ind) -> None:
+    """Both the single and the vectorized lookup reject negative indices and indices
+    beyond the system size."""
+    dof_manager = _dof_manager_with_fracture()
+    if ind == "size":
+        ind = dof_manager.num_dofs()
+    with pytest.raises(ValueError):
+        dof_manager.dof_to_grid_and_variable(ind)
+    with pytest.raises(ValueError):
+        dof_manager.dofs_to_grid_and_variable(np.array([0, ind]))
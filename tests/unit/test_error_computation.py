@@ -152,4 +152,98 @@ def test_l2_error_not_implemented_error(grids: list[pp.Grid, pp.MortarGrid]) ->
             is_cc=False,
             is_scalar=True,
         )
-    assert msg in str(excinfo.value)
\ No newline at end of file
+    assert msg in str(excinfo.value)
+
+
+
+@pytest.mark.parametrize("is_relative", [False, True])
+def test_l2_error_propagates_nan(
+    grids: list[pp.Grid, pp.MortarGrid], is_relative: bool
+) -> None:
+    """Test that a nan in the approximate array gives a nan error.
+
+    Parameters:
+        grids: List of grids. The first element is a two-dimensional subdomain grid,
+            and the second element is an interface grid. See the fixture grids().
+        is_relative: Whether the relative error is computed.
+
+    """
+    approx_array = np.zeros(8)
+    approx_array[3] = np.nan
+    actual_l2_error = pp.error_computation.l2_error(
+        grid=grids[0],
+        true_array=np.ones(8),
+        approx_array=approx_array,
+        is_cc=True,
+        is_scalar=False,
+        relative=is_relative,
+    )
+    assert np.isnan(actual_l2_error)
+
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, int, complex])
+@pytest.mark.parametrize("is_scalar", [True, False])
+def test_norm_L2(
+    grids: list[pp.Grid, pp.MortarGrid], dtype: type, is_scalar: bool
+) -> None:
+    """Test the L2 norm of scalar and vector fields of different types.
+
+    Parameters:
+        grids: List of grids. The first element is a two-dimensional subdomain grid,
+            and the second element is an interface grid. See the fixture grids().
+        dtype: Type of the field values.
+        is_scalar: Whether the field is a scalar field.
+
+    """
+    g = grids[0]
+    shape = (g.num_cells,) if is_scalar else (2, g.num_cells)
+    val = np.arange(1, np.prod(shape) + 1).reshape(shape).astype(dtype)
+    if dtype is complex:
+        val *= 1 + 1j
+    known = np.sqrt(np.sum(np.atleast_2d(val) ** 2 * g.cell_volumes))
+    assert np.isclose(pp.error_computation.norm_L2(g, val), known)
+
+@pytest.mark.parametrize(
+    "fun,supports_arrays",
+    [
+        (lambda pt: np.sin(2 * np.pi * pt[0]) * np.sin(2 * np.pi * pt[1]), True),
+        (lambda pt: [np.cos(np.pi * pt[0]), pt[0] * pt[1]], True),
+        (lambda pt: 1.0, True),
+        (lambda pt: pt[0] if pt[0] > 0.5 else pt[1], True),
+        # Functions reducing over the coordinates of a point. Evaluated on all cell
+        # centers at once, the reduction runs over all cells.
+        (lambda pt: pt / np.linalg.norm(pt), False),
+        (lambda pt: pt[0] ** 2 - np.sum(pt), False),
+    ],
+)
+def test_interpolate(
+    fun, supports_arrays: bool, grids: list[pp.Grid, pp.MortarGrid]
+) -> None:
+    """Test that interpolation agrees with cell-wise evaluation of the function.
+
+    The functions cover a scalar and a vector function which support array input, a
+    constant function, a function which can only be evaluated point-wise, and
+    functions with reductions over the coordinates, which do not act entry-wise.
+
+    Parameters:
+        fun: Function to be interpolated.
+        supports_arrays: Whether fun can be evaluated on all cell centers at once.
+        grids: List of grids. The first element is a two-dimensional subdomain grid,
+            and the second element is an interface grid. See the fixture grids().
+
+    """
+    g = grids[0]
+    known = np.array([fun(pt) for pt in g.cell_centers.T]).T
+    # The default evaluates point-wise, and is valid for all functions.
+    assert np.allclose(pp.error_computation.interpolate(g, fun), known)
+    assert np.allclose(
+        pp.error_computation.interpolate(g, fun, vectorized=False), known
+    )
+    vectorized = pp.error_computation.interpolate(g, fun, vectorized=True)
+    if supports_arrays:
+        assert np.allclose(vectorized, known)
+    else:
+        # Vectorized evaluation is wrong for these functions, yet cannot be detected
+        # from the shape of the values. This is why it is opt-in.
+        assert not np.allclose(vectorized, known)
@@ -53,6 +53,23 @@ class SortLinePairTest(unittest.TestCase):
         self.assertTrue(test_utils.compare_arrays(sp, known_lines))
         self.assertTrue(np.allclose(known_sort_ind, sort_ind))
 
+    def test_multiple_quads(self):
+        # Two quads, with segments in arbitrary order and orientation. The
+        # specialized kernel for quads should sort as the general one.
+        p = np.array(
+            [[1, 2, 7, 1], [5, 7, 5, 2], [3, 9, 4, 8], [4, 8, 9, 3]], dtype=np.int32
+        )
+        known_lines = np.array(
+            [[1, 5, 7, 2], [5, 7, 2, 1], [3, 4, 9, 8], [4, 9, 8, 3]], dtype=np.int32
+        )
+
+        sp = sort_points.sort_multiple_point_pairs(p)
+        self.assertTrue(np.array_equal(known_lines, sp))
+        self.assertEqual(sp.dtype, np.int32)
+
+        sp_general = sort_points._sort_multiple_point_pairs_numba(p)
+        self.assertTrue(np.array_equal(known_lines, sp_general))
+
 
 class TestSortPointPlane(unittest.TestCase):
     def test_points_already_in_xy_plane(self):
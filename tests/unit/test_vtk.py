@@ -333,11 +333,52 @@ def test_import_state_from_vtu_single_subdomains(setup, subdomain):
     )
 
 
-def test_mdg(setup):
+@pytest.mark.parametrize("subdomain", np.arange(7), indirect=True)
+def test_reorder_cells_single_subdomains(setup, subdomain):
+    """Test that exporting with reordered cells is a permutation of the cells, and
+    that importing the exported data restores the original cell order.
+
+    """
+
+    # Define grid
+    sd = subdomain.grid
+    sd.compute_geometry()
+    mdg = pp.meshing.subdomains_to_mdg([sd])
+    sd_data = mdg.subdomain_data(sd)
+
+    # Define data distinct for each cell
+    dummy_scalar = np.arange(sd.num_cells, dtype=float)
+
+    # Export data with reordered cells
+    save = pp.Exporter(
+        mdg,
+        setup.file_name,
+        setup.folder,
+        export_constants_separately=False,
+        reorder_cells=True,
+    )
+    save.write_vtu([(sd, "dummy_scalar", dummy_scalar)])
+    vtu_file = Path(f"{setup.folder}/{setup.file_name}_{sd.dim}.vtu")
+
+    # The exported cell ids are a permutation of the cells, and the data follows the
+    # cells.
+    vtu_data = meshio.read(vtu_file)
+    cell_id = np.concatenate(vtu_data.cell_data["cell_id"])
+    exported_scalar = np.concatenate(vtu_data.cell_data["dummy_scalar"])
+    assert np.array_equal(np.sort(cell_id), np.arange(sd.num_cells))
+    assert np.allclose(exported_scalar, dummy_scalar[cell_id])
+
+    # Import data and compare with the original data
+    save.import_state_from_vtu(vtu_files=vtu_file, keys=["dummy_scalar"])
+    assert np.allclose(sd_data[pp.TIME_STEP_SOLUTIONS]["dummy_scalar"][0], dummy_scalar)
+
+
+@pytest.mark.parametrize("background_writes", [False, True])
+def test_mdg(setup, background_writes):
     """Test Exporter for 2d mixed-dimensional grids for a two-fracture domain.
 
     Exporting of scalar and vectorial data, separately defined on both subdomains and
-    interfaces.
+    interfaces. The files are written both directly and by a background worker.
 
     """
 
@@ -383,9 +424,13 @@ def test_mdg(setup):
         setup.file_name,
         setup.folder,
         export_constants_separately=False,
+        background_writes=background_writes,
     )
     save.write_vtu(["dummy_scalar", "dummy_vector", "unique_dummy_scalar"])
 
+    # The worker writing in the background is released before write_vtu returns.
+    assert save._io_pool is None
+
     # Check that exported vtu files and reference files are the same.
     for appendix in ["1", "2", "mortar_1"]:
         assert _compare_vtu_files(
@@ -633,6 +678,29 @@ def test_constant_data(setup):
         )
 
 
+def test_updated_grid(setup):
+    """Test that the Exporter exports the current geometry of a grid which is not
+    fixed, also if the grid object is reused with moved nodes.
+
+    """
+
+    # Define grid
+    g = pp.StructuredTriangleGrid([3] * 2, [1] * 2)
+    g.compute_geometry()
+
+    # Export the grid, move its nodes, and export the same grid object again
+    save = pp.Exporter(g, setup.file_name, setup.folder, fixed_grid=False)
+    save.write_vtu(time_step=0)
+    g.nodes[:2] *= 2
+    save.write_vtu(time_step=1, grid=g)
+
+    # The exported points, here stored with the constant data, reflect the moved nodes
+    for time_step, scaling in zip([0, 1], [1, 2]):
+        file_name = f"{setup.file_name}_constant_2_00000{time_step}.vtu"
+        vtu_data = meshio.read(f"{setup.folder}/{file_name}")
+        assert np.allclose(vtu_data.points[:, :2].max(axis=0), scaling)
+
+
 def test_fracture_network_2d(setup):
     """Test of the export functionality of FractureNetwork2d."""
 